@@ -0,0 +1,116 @@
+# src/daily_task_planner/diagnostics/memory_tracker.py
+"""
+Live object counts and tracemalloc growth reports for long-running sessions.
+"""
+from typing import Dict, List, Optional
+import gc
+import tracemalloc
+
+from daily_task_planner.model.task_model import Task, Meeting, TodayData, Deliverable, TaskDetail
+from daily_task_planner.view.check_list import CheckListModel, CheckListView
+from daily_task_planner.view.tasks_pane import TaskTab
+
+# Name -> class of every object kind whose live count we report
+TRACKED_TYPES = {
+    "TaskTab": TaskTab,
+    "CheckListView": CheckListView,
+    "CheckListModel": CheckListModel,
+    "Task": Task,
+    "Meeting": Meeting,
+    "TodayData": TodayData,
+    "TaskDetail": TaskDetail,
+    "Deliverable": Deliverable,
+}
+
+
+def live_counts() -> Dict[str, int]:
+    """
+    Count live instances of the tracked types, plus the rows held by all
+    list models (the replacement for per-row QListWidgetItems).
+    """
+    gc.collect()
+    counts = dict.fromkeys(TRACKED_TYPES, 0)
+    counts["list rows"] = 0
+    types = tuple(TRACKED_TYPES.items())
+    for obj in gc.get_objects():
+        for name, cls in types:
+            if isinstance(obj, cls):
+                counts[name] += 1
+                if cls is CheckListModel:
+                    try:
+                        counts["list rows"] += obj.rowCount()
+                    except RuntimeError:
+                        pass  # C++ side already deleted
+                break
+    return counts
+
+
+class MemoryTracker:
+    """Keeps a baseline of counts and a tracemalloc snapshot to diff against."""
+
+    def __init__(self, frames: int = 1):
+        self._frames = frames
+        self.baseline_counts: Dict[str, int] = {}
+        self._baseline_snapshot: Optional[tracemalloc.Snapshot] = None
+        self._latest_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    @property
+    def running(self) -> bool:
+        return self._baseline_snapshot is not None
+
+    def start(self):
+        """Start tracing allocations and record the baseline."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+        self.baseline_counts = live_counts()
+        self._baseline_snapshot = self._take()
+        self._latest_snapshot = self._baseline_snapshot
+
+    def stop(self):
+        tracemalloc.stop()
+        self._baseline_snapshot = self._latest_snapshot = None
+
+    def snapshot(self):
+        if not self.running:
+            self.start()
+        self._latest_snapshot = self._take()
+
+    def count_growth(self) -> Dict[str, int]:
+        """Tracked types whose live count changed since the baseline."""
+        current = live_counts()
+        return {
+            name: count - self.baseline_counts.get(name, 0)
+            for name, count in current.items()
+            if count != self.baseline_counts.get(name, 0)
+        }
+
+    def top_growth(self, limit: int = 10) -> List[str]:
+        """Source lines with the largest allocation growth since the baseline."""
+        if self._baseline_snapshot is None or self._latest_snapshot is None:
+            return []
+        stats = self._latest_snapshot.compare_to(self._baseline_snapshot, "lineno")
+        return [str(stat) for stat in stats[:limit] if stat.size_diff > 0]
+
+    def report(self, limit: int = 10) -> str:
+        lines = ["Live objects:"]
+        for name, count in live_counts().items():
+            delta = count - self.baseline_counts.get(name, count)
+            lines.append(f"  {name}: {count}" + (f" ({delta:+d})" if delta else ""))
+        if self.running:
+            current, peak = tracemalloc.get_traced_memory()
+            lines.append(f"Traced memory: {current / 1024:.1f} KiB (peak {peak / 1024:.1f} KiB)")
+            growth = self.top_growth(limit)
+            lines.append("Top allocation growth:" if growth else "No allocation growth since baseline.")
+            lines.extend(f"  {line}" for line in growth)
+        else:
+            lines.append("Allocation tracing is off.")
+        return "\n".join(lines)
+
+    def _take(self) -> tracemalloc.Snapshot:
+        gc.collect()
+        snapshot = tracemalloc.take_snapshot()
+        # Leave out tracemalloc's own bookkeeping
+        return snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
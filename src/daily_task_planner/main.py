@@ -1,5 +1,7 @@
+import os
 import sys
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
 from daily_task_planner.view.main_window import MainWindow
 from daily_task_planner.presenter.today_presenter import TodayPresenter
 from daily_task_planner.presenter.tasks_presenter import TasksPresenter
@@ -16,12 +18,39 @@ def main():
     today_pane = TodayPane(model.today.tasks)
     tasks_pane = TasksPane()
 
-    today_presenter = TodayPresenter(today_pane, model)
-    tasks_presenter = TasksPresenter(tasks_pane, model)
+    # --- Optional operation trace for replaying real sessions ---
+    trace_path = os.environ.get("DAILY_TASK_PLANNER_TRACE")
+    today_presenter_cls, tasks_presenter_cls = TodayPresenter, TasksPresenter
+    if trace_path:
+        from daily_task_planner.trace.trace_recorder import TraceRecorder
+        recorder = TraceRecorder(trace_path, model)
+        today_presenter_cls = recorder.traced(TodayPresenter, "today")
+        tasks_presenter_cls = recorder.traced(TasksPresenter, "tasks")
+
+    today_presenter = today_presenter_cls(today_pane, model)
+    tasks_presenter = tasks_presenter_cls(tasks_pane, model)
+
+    if trace_path:
+        recorder.start()
+        app.aboutToQuit.connect(recorder.close)
 
     window = MainWindow(today_presenter, tasks_presenter)
     window.show()
 
+    # --- Roll over to a new day at midnight ---
+    rollover_timer = QTimer(window)
+    rollover_timer.timeout.connect(today_presenter.check_rollover)
+    rollover_timer.start(60_000)
+
+    # --- Optional sync with a sync server ---
+    sync_url = os.environ.get("DAILY_TASK_PLANNER_SYNC_URL")
+    if sync_url:
+        from daily_task_planner.sync.sync_service import SyncService
+        sync_service = SyncService(model, sync_url, parent=window)
+        sync_service.tasks_changed.connect(tasks_presenter.sync_tabs)
+        app.aboutToQuit.connect(sync_service.stop)
+        sync_service.start()
+
     # --- Run the app ---
     sys.exit(app.exec())
 
@@ -0,0 +1,137 @@
+# src/daily_task_planner/model/record_index.py
+"""
+Posting-list index over today tasks, tasks and deliverables.
+
+Each record is indexed under a handful of terms ("kind:task",
+"priority:high", "tag:release", "complete"). A query such as
+
+    priority:high tag:release not complete
+
+is answered by intersecting the posting sets of its terms (smallest
+first) and subtracting the negated ones, without visiting other records.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+PRIORITIES = ("low", "normal", "high")
+KINDS = ("today_task", "task", "deliverable")
+
+_EMPTY: Set[str] = frozenset()
+
+
+def normalize_tags(tags: Iterable[str]) -> List[str]:
+    """Lower-case, strip '#', drop blanks and duplicates, keep order."""
+    seen = []
+    for tag in tags:
+        tag = tag.strip().lstrip("#").strip().lower()
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
+
+
+def parse_query(expr: str) -> Tuple[List[str], List[str]]:
+    """
+    Split a query into (required terms, excluded terms). Terms are ANDed;
+    "not X", "-X" and "!X" exclude. "#x" is short for "tag:x", "done" for
+    "complete" and "incomplete" for "not complete". Raises ValueError for
+    unknown terms and for a "not" or "-" with no term after it.
+    """
+    required, excluded = [], []
+    negate = False
+    dangling = ""  # negation waiting for its term
+    for token in expr.split():
+        word = token.lower()
+        if word in ("and", "&&"):
+            continue
+        if word == "not":
+            negate, dangling = not negate, token
+            continue
+        if word in ("-", "!"):
+            negate, dangling = not negate, token
+            continue
+        if word[:1] in ("-", "!") and len(word) > 1:
+            negate, word = not negate, word[1:]
+
+        if word == "incomplete":
+            word, negate = "complete", not negate
+        elif word == "done":
+            word = "complete"
+        elif word.startswith("#"):
+            word = "tag:" + word[1:]
+
+        name, _, value = word.partition(":")
+        if word == "complete":
+            pass
+        elif name == "priority" and value in PRIORITIES:
+            pass
+        elif name == "kind" and value in KINDS:
+            pass
+        elif name == "tag" and value:
+            pass
+        else:
+            raise ValueError(f"Unknown query term: {token}")
+
+        (excluded if negate else required).append(word)
+        negate, dangling = False, ""
+    if dangling:
+        raise ValueError(f"Nothing to negate after '{dangling}'")
+    return required, excluded
+
+
+class RecordIndex:
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._terms: Dict[str, Set[str]] = {}    # record id -> indexed terms
+        self._records: Dict[str, object] = {}    # record id -> record
+
+    def clear(self):
+        self._postings.clear()
+        self._terms.clear()
+        self._records.clear()
+
+    def update(self, kind: str, record):
+        """(Re)index a record after it was added or changed."""
+        terms = {f"kind:{kind}", f"priority:{record.priority}"}
+        terms.update(f"tag:{tag}" for tag in record.tags)
+        if record.complete:
+            terms.add("complete")
+
+        old = self._terms.get(record.id, _EMPTY)
+        for term in old - terms:
+            self._postings[term].discard(record.id)
+        for term in terms - old:
+            self._postings[term].add(record.id)
+        self._terms[record.id] = terms
+        self._records[record.id] = record
+
+    def remove(self, record_id: str):
+        for term in self._terms.pop(record_id, _EMPTY):
+            self._postings[term].discard(record_id)
+        self._records.pop(record_id, None)
+
+    def record(self, record_id: str):
+        return self._records.get(record_id)
+
+    def query(self, expr: str, kinds: Optional[Iterable[str]] = None) -> Set[str]:
+        """Ids of the records matching `expr`, optionally limited to `kinds`."""
+        required, excluded = parse_query(expr)
+        sets = [self._postings.get(term, _EMPTY) for term in required]
+        if kinds is not None:
+            kinds = list(kinds)
+            if len(kinds) == 1:
+                sets.append(self._postings.get(f"kind:{kinds[0]}", _EMPTY))
+            else:
+                sets.append(set().union(*(self._postings.get(f"kind:{k}", _EMPTY) for k in kinds)))
+
+        if sets:
+            sets.sort(key=len)
+            result = set(sets[0])
+            for postings in sets[1:]:
+                if not result:
+                    break
+                result &= postings
+        else:
+            result = set(self._terms)
+        for term in excluded:
+            result -= self._postings.get(term, _EMPTY)
+        return result
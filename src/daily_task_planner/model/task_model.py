@@ -1,9 +1,27 @@
 # src/planner/model/task_model.py
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
-from typing import List
+from datetime import date
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional
 import json
+import uuid
 from pathlib import Path
 
+from daily_task_planner.model.record_index import (
+    RecordIndex, PRIORITIES, KINDS as INDEXED_KINDS, normalize_tags,
+)
+
+def new_id() -> str:
+    return uuid.uuid4().hex
+
+
+def carried_id(source_id: str, day: str) -> str:
+    """
+    Id for a record carried into `day` from `source_id`. Deterministic, so
+    machines rolling over independently produce the same records.
+    """
+    return uuid.uuid5(uuid.NAMESPACE_OID, f"{source_id}/{day}").hex
+
 # -----------------------------
 # TODAY pane models
 # -----------------------------
@@ -11,17 +29,39 @@ from pathlib import Path
 class Task:
     description: str
     complete: bool = False
+    id: str = field(default_factory=new_id)
+    priority: str = "normal"
+    tags: List[str] = field(default_factory=list)
 
 @dataclass
 class Meeting:
     time: str
     description: str
+    id: str = field(default_factory=new_id)
 
 @dataclass
 class TodayData:
     tasks: List[Task] = field(default_factory=list)
     meetings: List[Meeting] = field(default_factory=list)
     notes: str = ""
+    date: str = ""  # ISO date (YYYY-MM-DD) this day belongs to
+
+    def to_dict(self) -> dict:
+        return {
+            "date": self.date,
+            "tasks": [asdict(t) for t in self.tasks],
+            "meetings": [asdict(m) for m in self.meetings],
+            "notes": self.notes,
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> "TodayData":
+        return TodayData(
+            tasks=[Task(**t) for t in data.get("tasks", [])],
+            meetings=[Meeting(**m) for m in data.get("meetings", [])],
+            notes=data.get("notes", ""),
+            date=data.get("date", ""),
+        )
 
 # -----------------------------
 # TASKS pane models
@@ -30,6 +70,9 @@ class TodayData:
 class Deliverable:
     description: str
     complete: bool = False
+    id: str = field(default_factory=new_id)
+    priority: str = "normal"
+    tags: List[str] = field(default_factory=list)
 
 @dataclass
 class TaskDetail:
@@ -40,13 +83,23 @@ class TaskDetail:
     )
     deliverables: List[Deliverable] = field(default_factory=list)
     notes: str = ""
+    id: str = field(default_factory=new_id)  # stable across reorders/removals
+    priority: str = "normal"
+    tags: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return bool(self.deliverables) and all(d.complete for d in self.deliverables)
 
     def to_dict(self) -> dict:
         return {
+            "id": self.id,
             "title": self.title,
             "user_story": self.user_story,
             "deliverables": [asdict(d) for d in self.deliverables],
             "notes": self.notes,
+            "priority": self.priority,
+            "tags": list(self.tags),
         }
 
     @staticmethod
@@ -56,37 +109,231 @@ class TaskDetail:
             user_story=data.get("user_story", ""),
             deliverables=[Deliverable(**d) for d in data.get("deliverables", [])],
             notes=data.get("notes", ""),
+            id=data.get("id") or new_id(),
+            priority=data.get("priority", "normal"),
+            tags=data.get("tags", []),
         )
 
 # -----------------------------
 # Unified Model
 # -----------------------------
+# Change keys passed to listeners, one per area of the model. Commits also
+# carry a record_key() for each record they touched, so listeners such as
+# sync can look at just those records.
+TODAY_TASKS = "today.tasks"
+TODAY_MEETINGS = "today.meetings"
+TODAY_NOTES = "today.notes"
+TASKS = "tasks"
+HISTORY = "history"
+SETTINGS = "settings"
+
+ChangeListener = Callable[[FrozenSet[str]], None]
+
+
+def record_key(kind: str, record_id: str = "*") -> str:
+    """
+    Change key for one record ("task:<id>"), or for every record of `kind`
+    when no id is given. Kinds are "today_task", "meeting", "today" (the
+    day's notes, keyed by date), "task" and "deliverable".
+    """
+    return f"{kind}:{record_id}"
+
+
+def _check_priority(priority: str) -> str:
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}; expected one of {PRIORITIES}")
+    return priority
+
+
+def _add_legacy_ids(payload: dict):
+    """
+    Give records saved before they had ids an id derived from their place
+    in the file, in memory only. The same file always yields the same ids,
+    so nothing has to be written back on load; the ids are stored with the
+    next save.
+    """
+    today = payload.get("today", {})
+    groups = [("today_task", today.get("tasks", [])), ("meeting", today.get("meetings", [])),
+              ("task", payload.get("tasks", []))]
+    for i, task in enumerate(payload.get("tasks", [])):
+        groups.append((f"deliverable/{i}", task.get("deliverables", [])))
+    for kind, records in groups:
+        for position, record in enumerate(records):
+            if not record.get("id"):
+                record["id"] = uuid.uuid5(uuid.NAMESPACE_OID, f"legacy/{kind}/{position}").hex
+
+
+def read_history(path: Path) -> Iterator[TodayData]:
+    """Archived days from a history file, oldest first, one line at a time."""
+    if not path.exists():
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield TodayData.from_dict(json.loads(line))
+
+
 class UnifiedModel:
     """
     Single model for Today Pane + Tasks Pane
-    Handles persistence of all tasks, deliverables, meetings, and notes
+    Handles persistence of all tasks, deliverables, meetings, and notes,
+    plus the archive of previous days. Archived days live in a separate
+    JSON-lines file that is only appended to at rollover, so everyday
+    saves don't rewrite the history.
+
+    Read-only users such as report exports can pass load_history=False and
+    stream archived days with iter_history() instead of holding them all.
     """
 
-    def __init__(self):
+    def __init__(self, storage_path: Optional[Path] = None, load_history: bool = True):
         self.today = TodayData()
         self.tasks: List[TaskDetail] = []
-        self.storage_path = Path.home() / ".daily_task_planner.json"
+        self.history: List[TodayData] = []
+        self.carry_deliverables = False
+        self.storage_path = Path(storage_path) if storage_path else Path.home() / ".daily_task_planner.json"
+        self.history_path = self.storage_path.with_name(self.storage_path.stem + "_history.jsonl")
+
+        # Archived days not yet appended to history_path; None means the
+        # whole history must be written (history found in the main file)
+        self._unsaved_history: Optional[List[TodayData]] = []
+        self._history_loaded = load_history
+
+        # Change notification / batching state
+        self._listeners: List[ChangeListener] = []
+        self._batch_depth = 0
+        self._pending_changes: set[str] = set()
+        # Inside a batch: (object, state before its first change), to roll back
+        self._undo: Optional[list] = None
+        self._kept: set[int] = set()
+
+        # task id -> position in self.tasks, rebuilt lazily when stale
+        self._task_positions: Optional[dict[str, int]] = None
+
+        # Tag / priority / completion index over today tasks, tasks and deliverables
+        self.index = RecordIndex()
+
         self.load()
+        if not self.today.date:
+            self.today.date = date.today().isoformat()  # fresh model
+
+    # --- Change notification ---
+    def add_listener(self, listener: ChangeListener):
+        """Register a callback receiving the set of change keys after each commit."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ChangeListener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group several mutations into one transaction.
+
+        Saves and change notifications are suspended until the outermost
+        batch exits, then the model is written once and listeners receive one
+        coalesced change set. If an exception escapes, in-memory state is
+        rolled back to what it was when the outermost batch was entered.
+
+        Rollback restores only what the mutators recorded with _keep() before
+        changing it, so entering a batch costs nothing per record.
+        """
+        outermost = self._batch_depth == 0
+        if outermost:
+            attrs = ("today", "tasks", "history", "_unsaved_history", "carry_deliverables")
+            self._undo = [(self, {name: getattr(self, name) for name in attrs})]
+            self._kept = {id(self)}
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if outermost:
+                undo, self._undo = self._undo, None
+                for obj, state in reversed(undo):
+                    if isinstance(obj, list):
+                        obj[:] = state
+                    else:
+                        vars(obj).update(state)
+                self._task_positions = None
+                self._rebuild_index()
+                self._pending_changes.clear()
+            raise
+        self._batch_depth -= 1
+        if outermost:
+            self._undo = None
+            if self._pending_changes:
+                self._flush()
+
+    def _keep(self, *objs):
+        """Inside a batch, remember lists and records before their first change."""
+        if self._undo is None:
+            return
+        for obj in objs:
+            if obj is not None and id(obj) not in self._kept:
+                self._kept.add(id(obj))
+                self._undo.append((obj, obj[:] if isinstance(obj, list) else vars(obj).copy()))
+
+    def _commit(self, *changes: str):
+        self._pending_changes.update(changes)
+        if self._batch_depth == 0:
+            self._flush()
+
+    def _flush(self):
+        changes = frozenset(self._pending_changes)
+        self._pending_changes.clear()
+        self.save()
+        for listener in list(self._listeners):
+            listener(changes)
 
     # --- TODAY Pane Methods ---
     def add_today_task(self, description: str):
-        self.today.tasks.append(Task(description))
-        self.save()
+        task = Task(description)
+        self._keep(self.today.tasks)
+        self.today.tasks.append(task)
+        self.index.update("today_task", task)
+        self._commit(TODAY_TASKS, record_key("today_task", task.id))
 
     def set_today_task_complete(self, index: int, complete: bool):
         if 0 <= index < len(self.today.tasks):
+            self._keep(self.today.tasks[index])
             self.today.tasks[index].complete = complete
-            self.save()
+            self.index.update("today_task", self.today.tasks[index])
+            self._commit(TODAY_TASKS, record_key("today_task", self.today.tasks[index].id))
+
+    def set_today_task_priority(self, index: int, priority: str):
+        if 0 <= index < len(self.today.tasks):
+            self._keep(self.today.tasks[index])
+            self.today.tasks[index].priority = _check_priority(priority)
+            self.index.update("today_task", self.today.tasks[index])
+            self._commit(TODAY_TASKS, record_key("today_task", self.today.tasks[index].id))
+
+    def set_today_task_tags(self, index: int, tags: List[str]):
+        if 0 <= index < len(self.today.tasks):
+            self._keep(self.today.tasks[index])
+            self.today.tasks[index].tags = normalize_tags(tags)
+            self.index.update("today_task", self.today.tasks[index])
+            self._commit(TODAY_TASKS, record_key("today_task", self.today.tasks[index].id))
+
+    def update_today_task(self, index: int, description: str):
+        if 0 <= index < len(self.today.tasks):
+            self._keep(self.today.tasks[index])
+            self.today.tasks[index].description = description
+            self._commit(TODAY_TASKS, record_key("today_task", self.today.tasks[index].id))
+
+    def move_today_task(self, old_index: int, new_index: int):
+        tasks = self.today.tasks
+        if 0 <= old_index < len(tasks) and 0 <= new_index < len(tasks):
+            self._keep(tasks)
+            tasks.insert(new_index, tasks.pop(old_index))
+            self._commit(TODAY_TASKS, record_key("today_task", tasks[new_index].id))
 
     def remove_today_task(self, index: int):
         if 0 <= index < len(self.today.tasks):
-            del self.today.tasks[index]
-            self.save()
+            self._keep(self.today.tasks)
+            task = self.today.tasks.pop(index)
+            self.index.remove(task.id)
+            self._commit(TODAY_TASKS, record_key("today_task", task.id))
 
     def reorder_today_tasks(self, new_order: List[tuple[str, bool]]):
         """
@@ -102,53 +349,185 @@ class UnifiedModel:
                     break
             else:
                 reordered.append(Task(desc, complete))
+        self._keep(self.today)
         self.today.tasks = reordered
-        self.save()
+        self._rebuild_index()
+        self._commit(TODAY_TASKS, record_key("today_task"))
 
     def add_meeting(self, time: str, description: str):
-        self.today.meetings.append(Meeting(time, description))
-        self.save()
+        meeting = Meeting(time, description)
+        self._keep(self.today.meetings)
+        self.today.meetings.append(meeting)
+        self._commit(TODAY_MEETINGS, record_key("meeting", meeting.id))
 
     def remove_meeting(self, index: int):
         if 0 <= index < len(self.today.meetings):
-            del self.today.meetings[index]
-            self.save()
+            self._keep(self.today.meetings)
+            meeting = self.today.meetings.pop(index)
+            self._commit(TODAY_MEETINGS, record_key("meeting", meeting.id))
 
     def set_today_notes(self, text: str):
+        self._keep(self.today)
         self.today.notes = text
-        self.save()
+        self._commit(TODAY_NOTES, record_key("today", self.today.date))
+
+    # --- Day rollover ---
+    def needs_rollover(self, on: Optional[date] = None) -> bool:
+        on = on or date.today()
+        return self.today.date < on.isoformat()
+
+    def rollover_day(self, on: Optional[date] = None) -> bool:
+        """
+        Archive the current day and start a new one dated `on` (default: today).
+        Incomplete tasks are carried forward; when `carry_deliverables` is set,
+        undone deliverables from the Tasks pane are added as today's tasks too.
+        Runs as one batch: a single save and a single change notification.
+        Returns True if a rollover happened.
+        """
+        if not self.needs_rollover(on):
+            return False
+        on = on or date.today()
+
+        day = on.isoformat()
+        finished = self.today
+        carried = [
+            Task(t.description, id=carried_id(t.id, day), priority=t.priority, tags=list(t.tags))
+            for t in finished.tasks if not t.complete
+        ]
+        if self.carry_deliverables:
+            seen = {t.description for t in carried}
+            for task in self.tasks:
+                for d in task.deliverables:
+                    if not d.complete and d.description not in seen:
+                        carried.append(Task(
+                            d.description, id=carried_id(d.id, day),
+                            priority=d.priority, tags=list(d.tags),
+                        ))
+                        seen.add(d.description)
+
+        with self.batch():
+            self._keep(self.history, self._unsaved_history)
+            self.history.append(finished)
+            if self._unsaved_history is not None:
+                self._unsaved_history.append(finished)
+            self.today = TodayData(tasks=carried, date=day)
+            self._rebuild_index()
+            self._commit(TODAY_TASKS, TODAY_MEETINGS, TODAY_NOTES, HISTORY,
+                         record_key("today_task"), record_key("meeting"), record_key("today", day))
+        return True
+
+    def set_carry_deliverables(self, enabled: bool):
+        """Whether rollover also adds undone deliverables as today's tasks."""
+        if enabled != self.carry_deliverables:
+            self.carry_deliverables = enabled
+            self._commit(SETTINGS)
 
     # --- TASKS Pane Methods ---
-    def add_task(self):
-        self.tasks.append(TaskDetail())
-        self.save()
+    def task_index(self, task_id: str) -> Optional[int]:
+        """Current position of the task with `task_id`, or None if it is gone."""
+        positions = self._task_positions
+        if positions is not None:
+            index = positions.get(task_id)
+            if index is None:
+                if len(positions) == len(self.tasks):
+                    return None
+            elif index < len(self.tasks) and self.tasks[index].id == task_id:
+                return index
+        self._task_positions = {t.id: i for i, t in enumerate(self.tasks)}
+        return self._task_positions.get(task_id)
+
+    def add_task(self) -> TaskDetail:
+        task = TaskDetail()
+        self._keep(self.tasks)
+        self.tasks.append(task)
+        self.index.update("task", task)
+        if self._task_positions is not None:
+            self._task_positions[task.id] = len(self.tasks) - 1
+        self._commit(TASKS, record_key("task", task.id))
+        return task
 
     def remove_task(self, index: int):
         if 0 <= index < len(self.tasks):
-            del self.tasks[index]
-            self.save()
+            self._keep(self.tasks)
+            task = self.tasks.pop(index)
+            self.index.remove(task.id)
+            for d in task.deliverables:
+                self.index.remove(d.id)
+            self._task_positions = None
+            self._commit(TASKS, record_key("task", task.id),
+                         *(record_key("deliverable", d.id) for d in task.deliverables))
 
     def update_task_title(self, index: int, title: str):
         if 0 <= index < len(self.tasks):
+            self._keep(self.tasks[index])
             self.tasks[index].title = title
-            self.save()
+            self._commit(TASKS, record_key("task", self.tasks[index].id))
 
     def update_task_story(self, index: int, story: str):
         if 0 <= index < len(self.tasks):
+            self._keep(self.tasks[index])
             self.tasks[index].user_story = story
-            self.save()
+            self._commit(TASKS, record_key("task", self.tasks[index].id))
+
+    def set_task_priority(self, index: int, priority: str):
+        if 0 <= index < len(self.tasks):
+            self._keep(self.tasks[index])
+            self.tasks[index].priority = _check_priority(priority)
+            self.index.update("task", self.tasks[index])
+            self._commit(TASKS, record_key("task", self.tasks[index].id))
+
+    def set_task_tags(self, index: int, tags: List[str]):
+        if 0 <= index < len(self.tasks):
+            self._keep(self.tasks[index])
+            self.tasks[index].tags = normalize_tags(tags)
+            self.index.update("task", self.tasks[index])
+            self._commit(TASKS, record_key("task", self.tasks[index].id))
 
     def add_deliverable(self, task_index: int, description: str):
         if 0 <= task_index < len(self.tasks):
-            self.tasks[task_index].deliverables.append(Deliverable(description))
-            self.save()
+            task = self.tasks[task_index]
+            deliverable = Deliverable(description)
+            self._keep(task.deliverables)
+            task.deliverables.append(deliverable)
+            self.index.update("deliverable", deliverable)
+            self.index.update("task", task)  # completion depends on deliverables
+            self._commit(TASKS, record_key("deliverable", deliverable.id))
 
     def set_deliverable_complete(self, task_index: int, deliverable_index: int, complete: bool):
         if 0 <= task_index < len(self.tasks):
             deliverables = self.tasks[task_index].deliverables
             if 0 <= deliverable_index < len(deliverables):
+                self._keep(deliverables[deliverable_index])
                 deliverables[deliverable_index].complete = complete
-                self.save()
+                self.index.update("deliverable", deliverables[deliverable_index])
+                self.index.update("task", self.tasks[task_index])
+                self._commit(TASKS, record_key("deliverable", deliverables[deliverable_index].id))
+
+    def set_deliverable_priority(self, task_index: int, deliverable_index: int, priority: str):
+        if 0 <= task_index < len(self.tasks):
+            deliverables = self.tasks[task_index].deliverables
+            if 0 <= deliverable_index < len(deliverables):
+                self._keep(deliverables[deliverable_index])
+                deliverables[deliverable_index].priority = _check_priority(priority)
+                self.index.update("deliverable", deliverables[deliverable_index])
+                self._commit(TASKS, record_key("deliverable", deliverables[deliverable_index].id))
+
+    def set_deliverable_tags(self, task_index: int, deliverable_index: int, tags: List[str]):
+        if 0 <= task_index < len(self.tasks):
+            deliverables = self.tasks[task_index].deliverables
+            if 0 <= deliverable_index < len(deliverables):
+                self._keep(deliverables[deliverable_index])
+                deliverables[deliverable_index].tags = normalize_tags(tags)
+                self.index.update("deliverable", deliverables[deliverable_index])
+                self._commit(TASKS, record_key("deliverable", deliverables[deliverable_index].id))
+
+    def move_deliverable(self, task_index: int, old_index: int, new_index: int):
+        if 0 <= task_index < len(self.tasks):
+            deliverables = self.tasks[task_index].deliverables
+            if 0 <= old_index < len(deliverables) and 0 <= new_index < len(deliverables):
+                self._keep(deliverables)
+                deliverables.insert(new_index, deliverables.pop(old_index))
+                self._commit(TASKS, record_key("deliverable", deliverables[new_index].id))
 
     def reorder_deliverables(self, task_index: int, new_order: List[tuple[str, bool]]):
         if 0 <= task_index < len(self.tasks):
@@ -162,51 +541,176 @@ class UnifiedModel:
                         break
                 else:
                     reordered.append(Deliverable(desc, complete))
+            for d in old_deliverables:
+                self.index.remove(d.id)
+            self._keep(task)
             task.deliverables = reordered
-            self.save()
+            for d in reordered:
+                self.index.update("deliverable", d)
+            self._commit(TASKS, *(record_key("deliverable", d.id) for d in old_deliverables + reordered))
 
     def remove_deliverable(self, task_index: int, deliverable_index: int):
         if 0 <= task_index < len(self.tasks):
             deliverables = self.tasks[task_index].deliverables
             if 0 <= deliverable_index < len(deliverables):
-                del deliverables[deliverable_index]
-                self.save()
+                self._keep(deliverables)
+                deliverable = deliverables.pop(deliverable_index)
+                self.index.remove(deliverable.id)
+                self.index.update("task", self.tasks[task_index])
+                self._commit(TASKS, record_key("deliverable", deliverable.id))
 
     def update_task_notes(self, index: int, notes: str):
         if 0 <= index < len(self.tasks):
+            self._keep(self.tasks[index])
             self.tasks[index].notes = notes
-            self.save()
+            self._commit(TASKS, record_key("task", self.tasks[index].id))
+
+    # --- External changes ---
+    def apply_remote(self, today_tasks=None, meetings=None, notes=None, tasks=None,
+                     changed: Optional[Dict[str, object]] = None):
+        """
+        Replace whole parts of the model with state merged from elsewhere
+        (e.g. the sync server). Parts left as None are untouched; everything
+        is committed as one change set.
+
+        `changed` maps the record_key() of every record that differs to the
+        record (None if it was removed). When given, the parts may be the
+        current lists patched in place, and only those records are
+        re-indexed; otherwise the whole index is rebuilt. Inside a batch,
+        rollback restores the parts but not records patched in place.
+        """
+        self._keep(self.today)
+        changes = []
+        if today_tasks is not None:
+            self.today.tasks = today_tasks
+            changes.append(TODAY_TASKS)
+        if meetings is not None:
+            self.today.meetings = meetings
+            changes.append(TODAY_MEETINGS)
+        if notes is not None:
+            self.today.notes = notes
+            changes.append(TODAY_NOTES)
+        if tasks is not None:
+            self.tasks = tasks
+            self._task_positions = None
+            changes.append(TASKS)
+        if not changes:
+            return
+        if changed is None:
+            self._rebuild_index()
+        else:
+            for key, record in changed.items():
+                kind, _, record_id = key.partition(":")
+                if kind not in INDEXED_KINDS:
+                    continue
+                if record is None:
+                    self.index.remove(record_id)
+                else:
+                    self.index.update(kind, record)
+            changes.extend(changed)
+        self._commit(*changes)
+
+    # --- Queries ---
+    def query_ids(self, expr: str, kinds=None) -> set[str]:
+        """
+        Ids of today tasks, tasks and deliverables matching `expr`, e.g.
+        "priority:high tag:release not complete". `kinds` limits the result
+        to some of "today_task", "task" and "deliverable".
+        Raises ValueError for unknown terms.
+        """
+        return self.index.query(expr, kinds)
+
+    def query(self, expr: str, kinds=None) -> list:
+        """Records matching `expr` (see query_ids), in no particular order."""
+        return [self.index.record(i) for i in self.query_ids(expr, kinds)]
+
+    def _rebuild_index(self):
+        self.index.clear()
+        for t in self.today.tasks:
+            self.index.update("today_task", t)
+        for task in self.tasks:
+            self.index.update("task", task)
+            for d in task.deliverables:
+                self.index.update("deliverable", d)
 
     # --- Persistence ---
-    def save(self):
+    def to_payload(self, include_history: bool = False) -> dict:
         payload = {
-            "today": {
-                "tasks": [asdict(t) for t in self.today.tasks],
-                "meetings": [asdict(m) for m in self.today.meetings],
-                "notes": self.today.notes,
-            },
+            "today": self.today.to_dict(),
             "tasks": [t.to_dict() for t in self.tasks],
+            "settings": {"carry_deliverables": self.carry_deliverables},
         }
+        if include_history:
+            payload["history"] = [d.to_dict() for d in self.history]
+        return payload
+
+    def save(self):
         try:
             self.storage_path.parent.mkdir(exist_ok=True, parents=True)
+            # History first: a crash in between leaves the archived day in
+            # both files rather than in neither
+            self._save_history()
             with open(self.storage_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2)
+                json.dump(self.to_payload(), f, indent=2)
         except Exception as e:
             print(f"[WARN] Could not save data: {e}")
 
+    def _save_history(self):
+        if self._unsaved_history is None:
+            days, mode = self.history, "w"
+        elif self._unsaved_history:
+            days, mode = self._unsaved_history, "a"
+        else:
+            return
+        with open(self.history_path, mode, encoding="utf-8") as f:
+            for day in days:
+                f.write(json.dumps(day.to_dict()) + "\n")
+        self._unsaved_history = []
+
     def load(self):
         if not self.storage_path.exists():
+            self.history = self._load_history() if self._history_loaded else []
             return
         try:
             with open(self.storage_path, "r", encoding="utf-8") as f:
                 payload = json.load(f)
+            _add_legacy_ids(payload)
 
-            # TODAY pane
-            self.today.tasks = [Task(**t) for t in payload.get("today", {}).get("tasks", [])]
-            self.today.meetings = [Meeting(**m) for m in payload.get("today", {}).get("meetings", [])]
-            self.today.notes = payload.get("today", {}).get("notes", "")
+            # TODAY pane; files saved before days were dated belong to the
+            # day they were last written, so a stale day still rolls over
+            self.today = TodayData.from_dict(payload.get("today", {}))
+            if not self.today.date:
+                self.today.date = date.fromtimestamp(self.storage_path.stat().st_mtime).isoformat()
 
             # TASKS pane
             self.tasks = [TaskDetail.from_dict(t) for t in payload.get("tasks", [])]
+            self._task_positions = None
+
+            # Archived days; older versions kept them in the main file
+            if "history" in payload:
+                self.history = [TodayData.from_dict(d) for d in payload["history"]]
+                self._unsaved_history = None
+                self._history_loaded = True
+            else:
+                self.history = self._load_history() if self._history_loaded else []
+            self.carry_deliverables = payload.get("settings", {}).get("carry_deliverables", False)
+            self._rebuild_index()
         except Exception as e:
             print(f"[WARN] Could not load data: {e}")
+
+    def _load_history(self) -> List[TodayData]:
+        try:
+            return list(read_history(self.history_path))
+        except Exception as e:
+            print(f"[WARN] Could not load history: {e}")
+            return []
+
+    def iter_history(self) -> Iterator[TodayData]:
+        """Archived days, oldest first; streamed from disk if not loaded."""
+        if self._history_loaded:
+            yield from self.history
+            return
+        try:
+            yield from read_history(self.history_path)
+        except Exception as e:
+            print(f"[WARN] Could not load history: {e}")
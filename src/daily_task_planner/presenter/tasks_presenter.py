@@ -1,45 +1,158 @@
 # src/planner/presenter/tasks_presenter.py
-from daily_task_planner.model.task_model import UnifiedModel, Deliverable
+from functools import partial
+
+from daily_task_planner.model.task_model import UnifiedModel, Deliverable, TASKS
 
 
 class TasksPresenter:
+    # TaskTab signal -> presenter handler. Handlers take the task's current
+    # index as their first argument; it is resolved from the tab's stable
+    # task id when the signal fires, so removals never leave stale indices.
+    TAB_ROUTES = (
+        ("title_changed", "update_title"),
+        ("user_story_changed", "update_user_story"),
+        ("deliverable_added", "add_deliverable"),
+        ("deliverable_checked", "set_deliverable_complete"),
+        ("notes_changed", "update_notes"),
+        ("deliverables_reordered", "reorder_deliverables"),
+        ("deliverable_deleted", "remove_deliverable"),
+        ("complete_all_deliverables_requested", "complete_all_deliverables"),
+        ("clear_completed_deliverables_requested", "clear_completed_deliverables"),
+        ("priority_changed", "set_priority"),
+        ("tags_changed", "set_tags"),
+        ("deliverable_priority_changed", "set_deliverable_priority"),
+        ("deliverable_tags_changed", "set_deliverable_tags"),
+        ("deliverables_query_changed", "filter_deliverables"),
+    )
+
     def __init__(self, view, model: UnifiedModel):
         self.view = view
         self.model = model
 
+        # task id -> tab, and task id -> [(signal name, slot)] for disconnecting
+        self._tabs = {}
+        self._connections = {}
+
+        # Active queries: over tasks, and over each tab's deliverables by task id
+        self._task_query = ""
+        self._deliverable_queries = {}
+
         # Connect signals from view
         view.add_task_requested.connect(self.add_task)
         view.remove_task_requested.connect(self.remove_task)
+        view.task_query_changed.connect(self.filter_tasks)
+
+        # Re-run active queries when priorities, tags or completion change
+        model.add_listener(self._on_model_changed)
 
         # Map task tab signals
         self._connect_existing_tabs()
 
     # --- Tasks ---
     def add_task(self):
-        self.model.add_task()
-        index = len(self.model.tasks) - 1
-        tab = self.view.add_task_tab(self.model.tasks[index], index)
-        self._connect_tab_signals(tab, index)
+        task = self.model.add_task()
+        tab = self.view.add_task_tab(task)
+        self._connect_tab_signals(tab, task.id)
+        self._apply_task_query()
+
+    def remove_task(self, task_id: str):
+        index = self.model.task_index(task_id)
+        if index is not None:
+            self.model.remove_task(index)
+        self._release_tab(task_id)
 
-    def remove_task(self, index: int):
-        self.model.remove_task(index)
-        self.view.remove_task_tab(index)
+    def sync_tabs(self, task_ids=None):
+        """
+        Bring the tabs in line with the model after an external change
+        (e.g. sync). `task_ids` limits the work to the tasks that changed.
+        """
+        if task_ids is None:
+            task_ids = {task.id for task in self.model.tasks} | set(self._tabs)
+        for task_id in task_ids:
+            index = self.model.task_index(task_id)
+            tab = self._tabs.get(task_id)
+            if index is None:
+                self._release_tab(task_id)
+            elif tab is None:
+                tab = self.view.add_task_tab(self.model.tasks[index])
+                self._connect_tab_signals(tab, task_id)
+            else:
+                self.view.refresh_task_tab(tab, self.model.tasks[index])
+        self._apply_queries()
+
+    def filter_tasks(self, expr: str):
+        self._task_query = expr.strip()
+        self._apply_task_query()
 
     # --- Helpers ---
     def _connect_existing_tabs(self):
-        for i, task in enumerate(self.model.tasks):
-            tab = self.view.add_task_tab(task, i)
-            self._connect_tab_signals(tab, i)
-
-    def _connect_tab_signals(self, tab, index):
-        tab._task_index = index  
-        tab.title_changed.connect(lambda text: self.update_title(index, text))
-        tab.user_story_changed.connect(lambda story: self.update_user_story(index, story))
-        tab.deliverable_added.connect(lambda desc: self.add_deliverable(index, desc))
-        tab.deliverable_checked.connect(lambda di, c: self.set_deliverable_complete(index, di, c))
-        tab.notes_changed.connect(lambda notes: self.update_notes(index, notes))
-        tab.deliverables_reordered.connect(lambda task_index, order: self.reorder_deliverables(task_index, order))
-        tab.deliverable_deleted.connect(lambda di: self.remove_deliverable(index, di))
+        for task in self.model.tasks:
+            tab = self.view.add_task_tab(task)
+            self._connect_tab_signals(tab, task.id)
+
+    def _connect_tab_signals(self, tab, task_id):
+        self._tabs[task_id] = tab
+        connections = []
+        for signal_name, handler_name in self.TAB_ROUTES:
+            slot = partial(self._dispatch, task_id, handler_name)
+            getattr(tab, signal_name).connect(slot)
+            connections.append((signal_name, slot))
+        self._connections[task_id] = connections
+
+    def _release_tab(self, task_id):
+        tab = self._tabs.pop(task_id, None)
+        connections = self._connections.pop(task_id, [])
+        self._deliverable_queries.pop(task_id, None)
+        if tab is None:
+            return
+        for signal_name, slot in connections:
+            try:
+                getattr(tab, signal_name).disconnect(slot)
+            except (RuntimeError, TypeError):
+                pass  # already gone with the underlying C++ object
+        self.view.remove_task_tab(tab)
+
+    def _dispatch(self, task_id, handler_name, *args):
+        index = self.model.task_index(task_id)
+        if index is None:
+            return
+        getattr(self, handler_name)(index, *args)
+
+    def _tab_for(self, task_index):
+        return self._tabs.get(self.model.tasks[task_index].id)
+
+    def _refresh_deliverables(self, task_index):
+        tab = self._tab_for(task_index)
+        if tab is not None:
+            tab.populate_deliverables(self.model.tasks[task_index].deliverables)
+
+    def _run_query(self, expr, kind):
+        """(ids, error) for a query; ids is None when there is no query."""
+        if not expr:
+            return None, ""
+        try:
+            return self.model.query_ids(expr, kinds=[kind]), ""
+        except ValueError as e:
+            return None, str(e)
+
+    def _apply_task_query(self):
+        self.view.show_task_query_result(*self._run_query(self._task_query, "task"))
+
+    def _apply_deliverable_query(self, task_id):
+        tab = self._tabs.get(task_id)
+        if tab is not None:
+            expr = self._deliverable_queries.get(task_id, "")
+            tab.deliverables_filter.show_query_result(*self._run_query(expr, "deliverable"))
+
+    def _apply_queries(self):
+        if self._task_query:
+            self._apply_task_query()
+        for task_id in self._deliverable_queries:
+            self._apply_deliverable_query(task_id)
+
+    def _on_model_changed(self, changes):
+        if TASKS in changes:
+            self._apply_queries()
 
     # --- Task updates ---
     def update_title(self, index, title):
@@ -51,21 +164,55 @@ class TasksPresenter:
     def update_notes(self, index, notes):
         self.model.update_task_notes(index, notes)
 
+    def set_priority(self, index, priority):
+        self.model.set_task_priority(index, priority)
+
+    def set_tags(self, index, tags):
+        self.model.set_task_tags(index, tags)
+
     # --- Deliverables ---
     def add_deliverable(self, task_index, desc):
         self.model.add_deliverable(task_index, desc)
-        tab = self.view.tabs.widget(task_index)
-        tab.populate_deliverables(self.model.tasks[task_index].deliverables)
+        self._refresh_deliverables(task_index)
 
     def set_deliverable_complete(self, task_index, deliverable_index, complete):
         self.model.set_deliverable_complete(task_index, deliverable_index, complete)
 
-    def reorder_deliverables(self, task_index, new_order):
-        self.model.reorder_deliverables(task_index, new_order)
-        tab = self.view.tabs.widget(task_index)
-        tab.populate_deliverables(self.model.tasks[task_index].deliverables)
+    def reorder_deliverables(self, task_index, old_index, new_index):
+        self.model.move_deliverable(task_index, old_index, new_index)
+        self._refresh_deliverables(task_index)
+
+    def complete_all_deliverables(self, task_index):
+        deliverables = self.model.tasks[task_index].deliverables
+        with self.model.batch():
+            for i, d in enumerate(deliverables):
+                if not d.complete:
+                    self.model.set_deliverable_complete(task_index, i, True)
+        self._refresh_deliverables(task_index)
+
+    def clear_completed_deliverables(self, task_index):
+        with self.model.batch():
+            for i in reversed(range(len(self.model.tasks[task_index].deliverables))):
+                if self.model.tasks[task_index].deliverables[i].complete:
+                    self.model.remove_deliverable(task_index, i)
+        self._refresh_deliverables(task_index)
 
     def remove_deliverable(self, task_index, deliverable_index):
         self.model.remove_deliverable(task_index, deliverable_index)
-        tab = self.view.tabs.widget(task_index)
-        tab.populate_deliverables(self.model.tasks[task_index].deliverables)
+        self._refresh_deliverables(task_index)
+
+    def set_deliverable_priority(self, task_index, deliverable_index, priority):
+        self.model.set_deliverable_priority(task_index, deliverable_index, priority)
+        self._refresh_deliverables(task_index)
+
+    def set_deliverable_tags(self, task_index, deliverable_index, tags):
+        self.model.set_deliverable_tags(task_index, deliverable_index, tags)
+        self._refresh_deliverables(task_index)
+
+    def filter_deliverables(self, task_index, expr):
+        task_id = self.model.tasks[task_index].id
+        if expr.strip():
+            self._deliverable_queries[task_id] = expr.strip()
+        else:
+            self._deliverable_queries.pop(task_id, None)
+        self._apply_deliverable_query(task_id)
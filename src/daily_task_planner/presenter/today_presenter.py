@@ -1,11 +1,14 @@
 # src/planner/presenter/today_presenter.py
-from daily_task_planner.model.task_model import UnifiedModel
+from daily_task_planner.model.task_model import (
+    UnifiedModel, TODAY_TASKS, TODAY_MEETINGS, TODAY_NOTES,
+)
 
 
 class TodayPresenter:
     def __init__(self, view, model: UnifiedModel):
         self.view = view
         self.model = model
+        self._task_query = ""
 
         # Connect signals
         view.task_added.connect(self.add_task)
@@ -13,56 +16,102 @@ class TodayPresenter:
         view.task_checked.connect(self.set_task_complete)
         view.task_reordered.connect(self.reorder_tasks)
         view.task_deleted.connect(self.delete_task)
+        view.complete_all_requested.connect(self.complete_all_tasks)
+        view.clear_completed_requested.connect(self.clear_completed_tasks)
+        view.task_priority_changed.connect(self.set_task_priority)
+        view.task_tags_changed.connect(self.set_task_tags)
+        view.task_query_changed.connect(self.filter_tasks)
 
         view.meeting_added.connect(self.add_meeting)
         view.meeting_removed.connect(self.remove_meeting)
         view.notes_changed.connect(self.update_notes)
 
+        # The view is refreshed from model change notifications, so batched
+        # operations re-render once
+        model.add_listener(self._on_model_changed)
+
+        # Start a new day if the data on disk belongs to a previous one
+        self.model.rollover_day()
+
         # Initial render
         self.refresh_view()
 
     # --- TODAY Tasks ---
     def add_task(self, description: str):
         self.model.add_today_task(description)
-        self.refresh_view()
 
     def edit_task(self, index: int, new_text: str):
-        if 0 <= index < len(self.model.today.tasks):
-            self.model.today.tasks[index].description = new_text
-            self.model.save()
-            self.refresh_view()
+        self.model.update_today_task(index, new_text)
 
     def set_task_complete(self, index: int, complete: bool):
         self.model.set_today_task_complete(index, complete)
-        self.refresh_view()
 
-    def reorder_tasks(self, old_index: int, new_index: int):    
-        tasks = self.model.today.tasks
-        if 0 <= old_index < len(tasks) and 0 <= new_index < len(tasks):
-            task = tasks.pop(old_index)
-            tasks.insert(new_index, task)
-            self.model.save()
-            self.refresh_view()
+    def reorder_tasks(self, old_index: int, new_index: int):
+        self.model.move_today_task(old_index, new_index)
 
     def delete_task(self, index: int):
         self.model.remove_today_task(index)
-        self.refresh_view()
+
+    def set_task_priority(self, index: int, priority: str):
+        self.model.set_today_task_priority(index, priority)
+
+    def set_task_tags(self, index: int, tags: list):
+        self.model.set_today_task_tags(index, tags)
+
+    def filter_tasks(self, expr: str):
+        self._task_query = expr.strip()
+        self._apply_task_query()
+
+    def complete_all_tasks(self):
+        with self.model.batch():
+            for i, task in enumerate(self.model.today.tasks):
+                if not task.complete:
+                    self.model.set_today_task_complete(i, True)
+
+    def clear_completed_tasks(self):
+        with self.model.batch():
+            for i in reversed(range(len(self.model.today.tasks))):
+                if self.model.today.tasks[i].complete:
+                    self.model.remove_today_task(i)
 
     # --- Meetings ---
     def add_meeting(self, time: str, desc: str):
         self.model.add_meeting(time, desc)
-        self.refresh_view()
 
     def remove_meeting(self, index: int):
         self.model.remove_meeting(index)
-        self.refresh_view()
 
     # --- Notes ---
     def update_notes(self, text: str):
         self.model.set_today_notes(text)
-        self.refresh_view()
+
+    # --- Day rollover ---
+    def check_rollover(self):
+        """Called periodically so a session left open past midnight rolls over."""
+        self.model.rollover_day()
 
     # --- Refresh ---
+    def _apply_task_query(self):
+        if not self._task_query:
+            self.view.show_task_query_result(None)
+            return
+        try:
+            ids = self.model.query_ids(self._task_query, kinds=["today_task"])
+        except ValueError as e:
+            self.view.show_task_query_result(None, str(e))
+            return
+        self.view.show_task_query_result(ids)
+
+    def _on_model_changed(self, changes):
+        if TODAY_TASKS in changes:
+            self.view.update_task_list(self.model.today.tasks)
+            if self._task_query:
+                self._apply_task_query()
+        if TODAY_MEETINGS in changes:
+            self.view.update_meetings(self.model.today.meetings)
+        if TODAY_NOTES in changes:
+            self.view.update_notes(self.model.today.notes)
+
     def refresh_view(self):
         self.view.update_task_list(self.model.today.tasks)
         self.view.update_meetings(self.model.today.meetings)
@@ -0,0 +1,208 @@
+# src/daily_task_planner/report/report_generator.py
+"""
+Daily / weekly reports rendered as Markdown or HTML.
+
+Reports are produced as generators of text chunks and written straight to
+the output, so exporting years of history never holds the whole document
+in memory.
+"""
+from datetime import date, timedelta
+from html import escape
+from itertools import chain, groupby
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import argparse
+import sys
+
+from daily_task_planner.model.task_model import UnifiedModel, TodayData, TaskDetail
+
+FORMATS = {".md": "markdown", ".markdown": "markdown", ".html": "html", ".htm": "html"}
+
+
+# -----------------------------
+# Renderers
+# -----------------------------
+class MarkdownRenderer:
+    def document_start(self, title: str) -> Iterator[str]:
+        yield f"# {title}\n\n"
+
+    def document_end(self) -> Iterator[str]:
+        yield from ()
+
+    def heading(self, text: str, level: int = 2) -> Iterator[str]:
+        yield f"{'#' * level} {text}\n\n"
+
+    def day(self, day: TodayData) -> Iterator[str]:
+        yield f"### {day.date or 'Undated'}\n\n"
+        if day.tasks:
+            yield "**Tasks**\n\n"
+            for t in day.tasks:
+                yield f"- [{'x' if t.complete else ' '}] {t.description}\n"
+            yield "\n"
+        if day.meetings:
+            yield "**Meetings**\n\n"
+            for m in day.meetings:
+                yield f"- {m.time} — {m.description}\n"
+            yield "\n"
+        if day.notes.strip():
+            yield "**Notes**\n\n"
+            for line in day.notes.splitlines():
+                yield f"> {line}\n"
+            yield "\n"
+
+    def task(self, task: TaskDetail) -> Iterator[str]:
+        done = sum(d.complete for d in task.deliverables)
+        yield f"### {task.title} ({done}/{len(task.deliverables)})\n\n"
+        if task.user_story.strip():
+            yield f"_{task.user_story.strip()}_\n\n"
+        for d in task.deliverables:
+            yield f"- [{'x' if d.complete else ' '}] {d.description}\n"
+        if task.deliverables:
+            yield "\n"
+
+
+class HtmlRenderer:
+    def document_start(self, title: str) -> Iterator[str]:
+        yield (
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{escape(title)}</title>\n</head>\n<body>\n"
+            f"<h1>{escape(title)}</h1>\n"
+        )
+
+    def document_end(self) -> Iterator[str]:
+        yield "</body>\n</html>\n"
+
+    def heading(self, text: str, level: int = 2) -> Iterator[str]:
+        yield f"<h{level}>{escape(text)}</h{level}>\n"
+
+    def _checklist(self, items) -> Iterator[str]:
+        yield "<ul>\n"
+        for item in items:
+            mark = "&#9745;" if item.complete else "&#9744;"
+            yield f"<li>{mark} {escape(item.description)}</li>\n"
+        yield "</ul>\n"
+
+    def day(self, day: TodayData) -> Iterator[str]:
+        yield f"<h3>{escape(day.date or 'Undated')}</h3>\n"
+        if day.tasks:
+            yield "<h4>Tasks</h4>\n"
+            yield from self._checklist(day.tasks)
+        if day.meetings:
+            yield "<h4>Meetings</h4>\n<ul>\n"
+            for m in day.meetings:
+                yield f"<li>{escape(m.time)} &mdash; {escape(m.description)}</li>\n"
+            yield "</ul>\n"
+        if day.notes.strip():
+            yield f"<h4>Notes</h4>\n<blockquote><pre>{escape(day.notes)}</pre></blockquote>\n"
+
+    def task(self, task: TaskDetail) -> Iterator[str]:
+        done = sum(d.complete for d in task.deliverables)
+        yield f"<h3>{escape(task.title)} ({done}/{len(task.deliverables)})</h3>\n"
+        if task.user_story.strip():
+            yield f"<p><em>{escape(task.user_story.strip())}</em></p>\n"
+        if task.deliverables:
+            yield from self._checklist(task.deliverables)
+
+
+RENDERERS = {"markdown": MarkdownRenderer, "html": HtmlRenderer}
+
+
+# -----------------------------
+# Report generators
+# -----------------------------
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def iter_days(model: UnifiedModel, start: Optional[date] = None, end: Optional[date] = None) -> Iterator[TodayData]:
+    """Archived days followed by the current one, limited to [start, end]."""
+    lo = start.isoformat() if start else ""
+    hi = end.isoformat() if end else "9999-12-31"
+    for day in chain(model.iter_history(), [model.today]):
+        if day.date and lo <= day.date <= hi:
+            yield day
+
+
+def _tasks_section(model: UnifiedModel, renderer) -> Iterator[str]:
+    if model.tasks:
+        yield from renderer.heading("Task Progress")
+        for task in model.tasks:
+            yield from renderer.task(task)
+
+
+def daily_report(model: UnifiedModel, renderer, on: Optional[date] = None) -> Iterator[str]:
+    on = on or date.today()
+    yield from renderer.document_start(f"Daily Report — {on.isoformat()}")
+    for day in iter_days(model, on, on):
+        yield from renderer.day(day)
+    yield from _tasks_section(model, renderer)
+    yield from renderer.document_end()
+
+
+def weekly_report(model: UnifiedModel, renderer, week_of: Optional[date] = None) -> Iterator[str]:
+    start = week_start(week_of or date.today())
+    end = start + timedelta(days=6)
+    yield from renderer.document_start(f"Weekly Report — {start.isoformat()} to {end.isoformat()}")
+    for day in iter_days(model, start, end):
+        yield from renderer.day(day)
+    yield from _tasks_section(model, renderer)
+    yield from renderer.document_end()
+
+
+def history_report(model: UnifiedModel, renderer) -> Iterator[str]:
+    """Every recorded day, grouped by week."""
+    yield from renderer.document_start("Planner History")
+    days = iter_days(model)
+    for monday, week in groupby(days, key=lambda d: week_start(date.fromisoformat(d.date))):
+        yield from renderer.heading(f"Week of {monday.isoformat()}")
+        for day in week:
+            yield from renderer.day(day)
+    yield from _tasks_section(model, renderer)
+    yield from renderer.document_end()
+
+
+def format_for_path(path, default: str = "markdown") -> str:
+    return FORMATS.get(Path(path).suffix.lower(), default)
+
+
+def write_report(chunks: Iterable[str], path) -> None:
+    """Stream report chunks to `path`."""
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+def generate(model: UnifiedModel, period: str, fmt: str, on: Optional[date] = None) -> Iterator[str]:
+    renderer = RENDERERS[fmt]()
+    if period == "day":
+        return daily_report(model, renderer, on)
+    if period == "week":
+        return weekly_report(model, renderer, on)
+    return history_report(model, renderer)
+
+
+# -----------------------------
+# Command line
+# -----------------------------
+def main(argv=None):
+    """Export a report without starting the GUI."""
+    parser = argparse.ArgumentParser(description="Export a Daily Task Planner report.")
+    parser.add_argument("period", choices=("day", "week", "all"), help="report period")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=tuple(RENDERERS), help="defaults to the output file extension")
+    parser.add_argument("-d", "--date", type=date.fromisoformat, help="day (or a day in the week) to report on, YYYY-MM-DD")
+    parser.add_argument("--data", type=Path, help="planner data file (default: ~/.daily_task_planner.json)")
+    args = parser.parse_args(argv)
+
+    # Archived days are streamed from disk while the report is written
+    model = UnifiedModel(args.data, load_history=False)
+    fmt = args.format or format_for_path(args.output)
+    chunks = generate(model, args.period, fmt, args.date)
+    if args.output == "-":
+        sys.stdout.writelines(chunks)
+    else:
+        write_report(chunks, args.output)
+
+
+if __name__ == "__main__":
+    main()
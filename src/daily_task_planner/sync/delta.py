@@ -0,0 +1,538 @@
+# src/daily_task_planner/sync/delta.py
+"""
+Per-field deltas with version vectors.
+
+Every synced record is an entity key ("<kind>:<id>", the model's
+record_key()) holding a flat dict of fields. Each field stores the version
+vector of the edit that produced its value. Merging keeps the edit that
+dominates; concurrent edits pick a deterministic winner and merge their
+vectors, so every replica (and the server) converges on the same value
+field by field.
+
+Today's tasks and meetings carry the day they belong to, and the day's
+notes are keyed by date, so a replica that hasn't rolled over yet never
+shows (or archives and deletes) another replica's entities of a newer day.
+
+Work is proportional to what changed: local edits are diffed per record
+key from the model's change notifications, remote changes are patched
+into the existing records, and the state is saved through a journal.
+"""
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import json
+
+from daily_task_planner.model.task_model import (
+    UnifiedModel, Task, Meeting, Deliverable, TaskDetail, new_id, record_key,
+)
+from daily_task_planner.sync.journal import Journal
+
+# Entity kinds that belong to a single day
+DAY_KINDS = ("today_task", "meeting")
+
+# Every synced entity kind; "today" holds the notes of a day
+SYNCED_KINDS = ("today_task", "meeting", "today", "task", "deliverable")
+
+# Synced fields of each record kind, with the value used when one is missing
+RECORD_FIELDS = {
+    "today_task": {"description": "", "complete": False, "priority": "normal", "tags": []},
+    "meeting": {"time": "", "description": ""},
+    "task": {"title": "New Task", "user_story": "", "notes": "", "priority": "normal", "tags": []},
+    "deliverable": {"description": "", "complete": False, "priority": "normal", "tags": []},
+}
+
+
+# -----------------------------
+# Version vectors
+# -----------------------------
+def dominates(a: Dict[str, int], b: Dict[str, int]) -> bool:
+    """True if `a` has seen every edit `b` has."""
+    return all(a.get(replica, 0) >= n for replica, n in b.items())
+
+
+def merge_vv(a: Dict[str, int], b: Dict[str, int]) -> Dict[str, int]:
+    return {r: max(a.get(r, 0), b.get(r, 0)) for r in a.keys() | b.keys()}
+
+
+def _rank(entry: dict):
+    vv = entry["vv"]
+    return sum(vv.values()), sorted(vv.items()), json.dumps(entry["value"], sort_keys=True)
+
+
+def merge_entry(local: Optional[dict], remote: dict) -> dict:
+    """
+    Merge two {"value", "vv"} entries for the same field. Returns `local`
+    itself when it already wins, so callers can detect no-ops.
+    """
+    if local is None:
+        return remote
+    if dominates(local["vv"], remote["vv"]):
+        return local
+    if dominates(remote["vv"], local["vv"]):
+        return remote
+    winner = max(local, remote, key=_rank)
+    return {"value": winner["value"], "vv": merge_vv(local["vv"], remote["vv"])}
+
+
+# -----------------------------
+# Model <-> entities
+# -----------------------------
+def today_key(day: str) -> str:
+    """Entity key holding the notes of `day`."""
+    return record_key("today", day)
+
+
+def _containers(model: UnifiedModel, kind: str):
+    """(parent task or None, list) for every model list holding records of `kind`."""
+    if kind == "today_task":
+        yield None, model.today.tasks
+    elif kind == "meeting":
+        yield None, model.today.meetings
+    elif kind == "task":
+        yield None, model.tasks
+    elif kind == "deliverable":
+        for task in model.tasks:
+            yield task, task.deliverables
+
+
+def _entity_fields(model: UnifiedModel, kind: str, record, parent=None) -> dict:
+    """Synced fields of a model record, apart from its position."""
+    values = {name: getattr(record, name) for name in RECORD_FIELDS[kind]}
+    if "tags" in values:
+        values["tags"] = list(values["tags"])
+    if kind in DAY_KINDS:
+        values["day"] = model.today.date
+    elif kind == "deliverable":
+        values["task"] = parent.id
+    return values
+
+
+def _new_record(kind: str, ident: str):
+    if kind == "today_task":
+        return Task("", id=ident)
+    if kind == "meeting":
+        return Meeting("", "", id=ident)
+    if kind == "task":
+        return TaskDetail(id=ident)
+    return Deliverable("", id=ident)
+
+
+def _is_order(order) -> bool:
+    return isinstance(order, (int, float)) and not isinstance(order, bool)
+
+
+class SyncState:
+    """
+    The replica's view of every synced field, persisted between sessions.
+    Local edits are found by diffing changed model records against it;
+    remote changes are merged into it and then patched into the model.
+    Local edits stay in `unacked` until the server has accepted them, so
+    edits made offline are pushed again on the next start.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.replica_id = new_id()
+        self.counter = 0  # this replica's component in version vectors
+        self.since = 0    # last server sequence number pulled
+        self.fields: Dict[str, Dict[str, dict]] = {}
+        # (key, field) -> latest local change the server hasn't acknowledged
+        self.unacked: Dict[Tuple[str, str], dict] = {}
+
+        # kind -> entity keys, so one kind is found without scanning all
+        self._keys_by_kind: Dict[str, Set[str]] = {}
+        # Journal records not yet saved, and the counters last saved
+        self._journal = Journal(self.path)
+        self._log: List[dict] = []
+        self._saved_meta = None
+        self.load()
+
+    # --- Local edits ---
+    def record_local(self, model: UnifiedModel, keys: Iterable[str]) -> List[dict]:
+        """
+        Diff the model records named by `keys` (record_key()s from change
+        notifications; "<kind>:*" means every record of the kind) against
+        the stored state and return the changed fields.
+        """
+        changes: List[dict] = []
+        keys = set(keys)
+        whole = {key[:-2] for key in keys if key.endswith(":*")}
+        for kind in SYNCED_KINDS:
+            if kind in whole:
+                self._record_kind(model, kind, changes)
+
+        # Changed records grouped by the list holding them: id(list) -> (kind, parent, list, positions)
+        groups = {}
+        holders = {}
+        for key in keys:
+            kind, _, ident = key.partition(":")
+            if kind in whole or kind not in SYNCED_KINDS:
+                continue
+            if kind == "today":
+                if ident == model.today.date:
+                    self._record_notes(model, changes)
+                continue
+            found = self._locate(model, kind, ident, holders)
+            if found is None:
+                self._delete(model, key, changes)
+                continue
+            parent, rows, position = found
+            groups.setdefault(id(rows), (kind, parent, rows, set()))[3].add(position)
+
+        for kind, parent, rows, positions in groups.values():
+            self._record_rows(model, kind, parent, rows, sorted(positions), changes)
+        return changes
+
+    def _record_kind(self, model: UnifiedModel, kind: str, changes: List[dict]):
+        """Diff every record of `kind`, marking the ones no longer in the model deleted."""
+        if kind == "today":
+            self._record_notes(model, changes)
+            return
+        seen = set()
+        for parent, rows in _containers(model, kind):
+            self._record_group(model, kind, parent, rows, changes)
+            seen.update(record_key(kind, r.id) for r in rows)
+        for key in self._keys_by_kind.get(kind, set()) - seen:
+            self._delete(model, key, changes)
+
+    def _record_group(self, model: UnifiedModel, kind: str, parent, rows: list, changes: List[dict]):
+        """Diff a whole list, keeping stored positions while they are still increasing."""
+        prev = None
+        for record in rows:
+            key = record_key(kind, record.id)
+            order = self.value(key, "order")
+            if not _is_order(order) or (prev is not None and order <= prev):
+                order = 0 if prev is None else prev + 1
+            prev = order
+            self._record_entity(key, _entity_fields(model, kind, record, parent), order, changes)
+
+    def _record_rows(self, model: UnifiedModel, kind: str, parent, rows: list,
+                     positions: List[int], changes: List[dict]):
+        """Diff the records at `positions`, placing each between its neighbours."""
+        pending = {rows[i].id for i in positions}
+        for i in positions:
+            order = self._place(kind, rows, i, pending)
+            if order is None:
+                # No room between the neighbours: renumber the list
+                self._record_group(model, kind, parent, rows, changes)
+                return
+            pending.discard(rows[i].id)
+            self._record_entity(record_key(kind, rows[i].id), _entity_fields(model, kind, rows[i], parent),
+                                order, changes)
+
+    def _place(self, kind: str, rows: list, i: int, pending: Set[str]):
+        """
+        Position for rows[i]: its stored one if still between its
+        neighbours', else their midpoint. Records still in `pending` are
+        placed after this one and don't bound it. None if there is no room.
+        """
+        def stored(j):
+            order = self.value(record_key(kind, rows[j].id), "order")
+            return order if _is_order(order) else None
+
+        lo = hi = None
+        if i > 0:
+            lo = stored(i - 1)
+            if lo is None:
+                return None
+        j = i + 1
+        while j < len(rows) and rows[j].id in pending:
+            j += 1
+        if j < len(rows):
+            hi = stored(j)
+            if hi is None:
+                return None
+
+        order = stored(i)
+        if order is not None and (lo is None or lo < order) and (hi is None or order < hi):
+            return order
+        if lo is None:
+            return 0 if hi is None else hi - 1
+        if hi is None:
+            return lo + 1
+        middle = (lo + hi) / 2
+        return middle if lo < middle < hi else None
+
+    def _record_entity(self, key: str, values: dict, order, changes: List[dict]):
+        for field_name, value in dict(values, order=order, deleted=False).items():
+            self._edit(key, field_name, value, changes)
+
+    def _record_notes(self, model: UnifiedModel, changes: List[dict]):
+        key = today_key(model.today.date)
+        if key not in self.fields and not model.today.notes:
+            # A day's empty notes are the default, not an edit that could
+            # win against another replica's notes
+            return
+        self._edit(key, "notes", model.today.notes, changes)
+
+    def _delete(self, model: UnifiedModel, key: str, changes: List[dict]):
+        if key not in self.fields or self.value(key, "deleted"):
+            return
+        if key.partition(":")[0] in DAY_KINDS and self.value(key, "day") != model.today.date:
+            return  # another day's entity, archived rather than deleted
+        self._edit(key, "deleted", True, changes)
+
+    def _locate(self, model: UnifiedModel, kind: str, ident: str, holders: dict):
+        """
+        (parent task or None, list, position) of a model record, or None if
+        it is gone. Deliverables are looked for under their stored task
+        first; `holders` caches the full deliverable -> task map otherwise.
+        """
+        if kind == "task":
+            position = model.task_index(ident)
+            return None if position is None else (None, model.tasks, position)
+        if kind == "deliverable":
+            position = model.task_index(self.value(record_key(kind, ident), "task") or "")
+            parent = model.tasks[position] if position is not None else None
+            if parent is None or all(d.id != ident for d in parent.deliverables):
+                if model.index.record(ident) is None:
+                    return None
+                if not holders:
+                    holders.update(self._deliverable_tasks(model))
+                parent = holders.get(ident)
+                if parent is None:
+                    return None
+            rows = parent.deliverables
+        else:
+            parent, rows = next(_containers(model, kind))
+        for position, record in enumerate(rows):
+            if record.id == ident:
+                return parent, rows, position
+        return None
+
+    def _deliverable_tasks(self, model: UnifiedModel) -> Dict[str, TaskDetail]:
+        """deliverable id -> task holding it."""
+        return {d.id: task for task in model.tasks for d in task.deliverables}
+
+    def _edit(self, key: str, field_name: str, value, changes: List[dict]):
+        entry = self._entity(key).get(field_name)
+        if entry is not None and entry["value"] == value:
+            return
+        self.counter += 1
+        vv = dict(entry["vv"]) if entry else {}
+        vv[self.replica_id] = self.counter
+        self.fields[key][field_name] = {"value": value, "vv": vv}
+        change = {"key": key, "field": field_name, "value": value, "vv": vv}
+        self.unacked[(key, field_name)] = change
+        self._log.append({"op": "set", "local": True, **change})
+        changes.append(change)
+
+    def pending(self) -> List[dict]:
+        """Local changes not yet acknowledged by the server."""
+        return list(self.unacked.values())
+
+    def ack(self, changes: Iterable[dict]):
+        """Forget pushed changes the server accepted, unless edited again since."""
+        for change in changes:
+            slot = (change["key"], change["field"])
+            current = self.unacked.get(slot)
+            if current is not None and current["vv"] == change["vv"]:
+                del self.unacked[slot]
+                self._log.append({"op": "ack", "key": slot[0], "field": slot[1], "vv": change["vv"]})
+
+    # --- Remote changes ---
+    def merge_remote(self, changes: Iterable[dict]) -> Set[str]:
+        """Merge changes from the server; returns the keys of entities whose values changed."""
+        changed_keys = set()
+        for change in changes:
+            key, field_name = change["key"], change["field"]
+            stored = self._entity(key)
+            entry = stored.get(field_name)
+            winner = merge_entry(entry, {"value": change["value"], "vv": change["vv"]})
+            if winner is not entry:
+                stored[field_name] = winner
+                self._log.append({"op": "set", "key": key, "field": field_name, **winner})
+                if entry is None or winner["value"] != entry["value"]:
+                    changed_keys.add(key)
+            # Recover our own counter if local state was lost
+            self.counter = max(self.counter, change["vv"].get(self.replica_id, 0))
+        return changed_keys
+
+    def apply_to_model(self, model: UnifiedModel, keys: Iterable[str]) -> Dict[str, object]:
+        """
+        Patch the entities named by `keys` (as returned by merge_remote;
+        "<kind>:*" for every entity of a kind) into the model in one commit.
+        Only the lists holding them are re-sorted. Returns the record_key ->
+        record (None if removed) map of what changed, including the tasks
+        whose deliverables changed.
+        """
+        by_kind: Dict[str, Set[str]] = {}
+        for key in keys:
+            kind, _, ident = key.partition(":")
+            if ident == "*":
+                ident_keys = self._keys_by_kind.get(kind, set())
+                by_kind.setdefault(kind, set()).update(k.partition(":")[2] for k in ident_keys)
+            else:
+                by_kind.setdefault(kind, set()).add(ident)
+
+        changed: Dict[str, object] = {}
+        parts = {}
+        today = model.today.date
+        if "today_task" in by_kind:
+            self._patch_rows(model.today.tasks, "today_task", by_kind["today_task"],
+                             lambda values: values.get("day") == today, changed)
+            parts["today_tasks"] = model.today.tasks
+        if "meeting" in by_kind:
+            self._patch_rows(model.today.meetings, "meeting", by_kind["meeting"],
+                             lambda values: values.get("day") == today, changed)
+            parts["meetings"] = model.today.meetings
+        if today in by_kind.get("today", ()):
+            parts["notes"] = self.value(today_key(today), "notes") or ""
+
+        if "task" in by_kind or "deliverable" in by_kind:
+            deliverable_ids = by_kind.get("deliverable", set())
+            if "task" in by_kind:
+                created = self._patch_rows(model.tasks, "task", by_kind["task"], lambda values: True, changed)
+                if created:
+                    # Deliverables that arrived before their task
+                    for key in self._keys_by_kind.get("deliverable", ()):
+                        if self.value(key, "task") in created:
+                            deliverable_ids.add(key.partition(":")[2])
+            if deliverable_ids:
+                # model.task_index() is stale until apply_remote, so look tasks up here
+                tasks_by_id = {task.id: task for task in model.tasks}
+                self._patch_deliverables(model, deliverable_ids, tasks_by_id, changed)
+            parts["tasks"] = model.tasks
+
+        model.apply_remote(**parts, changed=changed)
+        return changed
+
+    def _patch_rows(self, rows: list, kind: str, idents: Iterable[str], keep, changed: dict) -> Set[str]:
+        """
+        Update, add or remove the records `idents` in `rows` from the stored
+        state; records whose values fail `keep` are removed. Re-sorts `rows`
+        and returns the ids of the records added.
+        """
+        by_id = {record.id: record for record in rows}
+        created = set()
+        for ident in idents:
+            key = record_key(kind, ident)
+            values = self._values(key)
+            record = by_id.get(ident)
+            if values is None or values.get("deleted") or not keep(values):
+                if record is not None:
+                    rows.remove(record)
+                    del by_id[ident]
+                    changed.setdefault(key, None)
+                    for d in getattr(record, "deliverables", ()):
+                        changed.setdefault(record_key("deliverable", d.id), None)
+                continue
+            if record is None:
+                record = by_id[ident] = _new_record(kind, ident)
+                rows.append(record)
+                created.add(ident)
+            for name, default in RECORD_FIELDS[kind].items():
+                value = values.get(name, default)
+                setattr(record, name, list(value) if name == "tags" else value)
+            if "complete" in RECORD_FIELDS[kind]:
+                record.complete = bool(record.complete)
+            changed[key] = record
+        rows.sort(key=lambda record: (self._order(kind, record.id), record.id))
+        return created
+
+    def _patch_deliverables(self, model: UnifiedModel, idents: Set[str],
+                            tasks_by_id: Dict[str, TaskDetail], changed: dict):
+        """Patch deliverables into the lists of the tasks they were and now belong to."""
+        holders = None
+        per_task: Dict[str, Set[str]] = {}
+        for ident in idents:
+            target = self.value(record_key("deliverable", ident), "task")
+            per_task.setdefault(target, set()).add(ident)
+            # Usually already under its task; otherwise it is new or moving
+            task = tasks_by_id.get(target)
+            if task is not None and any(d.id == ident for d in task.deliverables):
+                continue
+            if model.index.record(ident) is None:
+                continue
+            if holders is None:
+                holders = self._deliverable_tasks(model)
+            holder = holders.get(ident)
+            if holder is not None:
+                per_task.setdefault(holder.id, set()).add(ident)
+
+        for task_id, task_idents in per_task.items():
+            task = tasks_by_id.get(task_id)
+            if task is None:
+                continue  # task deleted or not here yet; picked up when it arrives
+            self._patch_rows(task.deliverables, "deliverable", task_idents,
+                             lambda values, task_id=task_id: values.get("task") == task_id, changed)
+            changed[record_key("task", task_id)] = task
+
+    # --- Lookups ---
+    def value(self, key: str, field_name: str):
+        entry = self.fields.get(key, {}).get(field_name)
+        return entry["value"] if entry else None
+
+    def _values(self, key: str) -> Optional[dict]:
+        fields = self.fields.get(key)
+        if fields is None:
+            return None
+        return {name: entry["value"] for name, entry in fields.items()}
+
+    def _order(self, kind: str, ident: str):
+        order = self.value(record_key(kind, ident), "order")
+        return order if _is_order(order) else 0
+
+    def _entity(self, key: str) -> Dict[str, dict]:
+        """Stored fields of `key`, created (and indexed by kind) if new."""
+        fields = self.fields.get(key)
+        if fields is None:
+            fields = self.fields[key] = {}
+            self._keys_by_kind.setdefault(key.partition(":")[0], set()).add(key)
+        return fields
+
+    # --- Persistence ---
+    def save(self):
+        """Append what changed since the last save to the journal."""
+        meta = {"op": "meta", "counter": self.counter, "since": self.since}
+        records, self._log = self._log, []
+        if meta != self._saved_meta:
+            records.append(meta)
+        try:
+            self._journal.write(records, self._snapshot, len(self.fields))
+            self._saved_meta = meta
+        except Exception as e:
+            self._log = [r for r in records if r is not meta]
+            print(f"[WARN] Could not save sync state: {e}")
+
+    def _snapshot(self) -> dict:
+        return {
+            "replica_id": self.replica_id,
+            "counter": self.counter,
+            "since": self.since,
+            "fields": self.fields,
+            "unacked": list(self.unacked.values()),
+        }
+
+    def load(self):
+        try:
+            payload, records = self._journal.load()
+            if payload is not None:
+                self.replica_id = payload.get("replica_id", self.replica_id)
+                self.counter = payload.get("counter", 0)
+                self.since = payload.get("since", 0)
+                for key, fields in payload.get("fields", {}).items():
+                    self._entity(key).update(fields)
+                self.unacked = {(c["key"], c["field"]): c for c in payload.get("unacked", [])}
+            for record in records:
+                self._replay(record)
+        except Exception as e:
+            print(f"[WARN] Could not load sync state: {e}")
+
+    def _replay(self, record: dict):
+        op = record.get("op")
+        if op == "set":
+            key, field_name = record["key"], record["field"]
+            stored = self._entity(key)
+            stored[field_name] = merge_entry(stored.get(field_name), {"value": record["value"], "vv": record["vv"]})
+            if record.get("local"):
+                self.unacked[(key, field_name)] = {
+                    "key": key, "field": field_name, "value": record["value"], "vv": record["vv"],
+                }
+        elif op == "ack":
+            slot = (record["key"], record["field"])
+            current = self.unacked.get(slot)
+            if current is not None and current["vv"] == record["vv"]:
+                del self.unacked[slot]
+        elif op == "meta":
+            self.counter = max(self.counter, record["counter"])
+            self.since = max(self.since, record["since"])
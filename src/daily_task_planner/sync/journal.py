@@ -0,0 +1,73 @@
+# src/daily_task_planner/sync/journal.py
+"""
+A JSON snapshot plus an append-only log of the records changed since it.
+
+Saves append only the changed records to "<file>.log", one JSON object per
+line. Once the log holds more lines than the snapshot holds records, it is
+compacted: the snapshot is rewritten from the full state and the log
+emptied, so a save costs O(changes) amortised rather than O(state).
+
+Loading returns the snapshot and the logged records for the owner to
+replay in order. Replaying must be idempotent: a crash during compaction
+can replay records the new snapshot already contains.
+"""
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+import json
+import os
+
+
+class Journal:
+    COMPACT_MIN = 1000  # log lines always allowed before compacting
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.log_path = self.path.with_name(self.path.name + ".log")
+        self._log_lines = 0
+        self._torn = False
+
+    def load(self) -> Tuple[Optional[dict], List[dict]]:
+        """(snapshot or None if there is none yet, records logged since it)."""
+        snapshot = None
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        records = []
+        if self.log_path.exists():
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # Last line of an interrupted save; compact it away
+                        self._torn = True
+                        break
+        self._log_lines = len(records)
+        return snapshot, records
+
+    def write(self, records: List[dict], snapshot: Callable[[], dict], size: int):
+        """
+        Log `records`, or compact into `snapshot()` instead when there is no
+        snapshot yet or the log would outgrow `size`, the number of records
+        in the full state.
+        """
+        if (self._torn or not self.path.exists()
+                or self._log_lines + len(records) > max(self.COMPACT_MIN, size)):
+            self.compact(snapshot())
+        elif records:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(record) + "\n" for record in records))
+            self._log_lines += len(records)
+
+    def compact(self, snapshot: dict):
+        """Replace the snapshot with `snapshot` and empty the log."""
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        # Write aside and swap, so a crash never leaves a partial snapshot
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self.path)
+        with open(self.log_path, "w", encoding="utf-8"):
+            pass
+        self._log_lines = 0
+        self._torn = False
@@ -0,0 +1,107 @@
+# src/daily_task_planner/sync/sync_client.py
+"""
+Background HTTP client for the sync server.
+
+Pushes and pulls run on a worker thread over one persistent connection.
+Outgoing change batches queued while a request is in flight are sent
+together. Pulled results ({"seq", "changes"}) and acknowledgements of
+pushed changes ({"acked": changes}) are handed back through `inbox` for
+the UI thread to merge.
+"""
+from typing import List, Optional
+from urllib.parse import urlsplit
+import http.client
+import json
+import queue
+import threading
+
+
+class SyncClient:
+    def __init__(self, url: str, replica_id: str, since: int = 0,
+                 poll_interval: float = 5.0, timeout: float = 10.0):
+        parts = urlsplit(url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or "127.0.0.1"
+        self._port = parts.port
+        self._base = parts.path.rstrip("/")
+        self._timeout = timeout
+        self.replica_id = replica_id
+        self.poll_interval = poll_interval
+
+        self.inbox: "queue.Queue[dict]" = queue.Queue()
+        self._outbox: "queue.Queue[List[dict]]" = queue.Queue()
+        self._since = since
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Called from the UI thread ---
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="planner-sync", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def push(self, changes: List[dict]):
+        self._outbox.put(changes)
+        self._wake.set()
+
+    def sync_now(self):
+        self._wake.set()
+
+    # --- Worker thread ---
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            changes = self._drain_outbox()
+            try:
+                if changes:
+                    self._request("POST", "/push", {"replica": self.replica_id, "changes": changes})
+                    self.inbox.put({"acked": changes})
+                    changes = []
+                result = self._request("GET", f"/pull?since={self._since}")
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                print(f"[WARN] Sync failed: {e}")
+                self._close()
+                if changes:
+                    self._outbox.put(changes)  # merging is order-independent
+                self._stop.wait(self.poll_interval)
+                continue
+            if result.get("changes"):
+                self.inbox.put(result)
+            self._since = max(self._since, result.get("seq", 0))
+        self._close()
+
+    def _drain_outbox(self) -> List[dict]:
+        changes: List[dict] = []
+        while True:
+            try:
+                changes.extend(self._outbox.get_nowait())
+            except queue.Empty:
+                return changes
+
+    def _request(self, method: str, path: str, payload: Optional[dict] = None) -> dict:
+        if self._conn is None:
+            cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            self._conn = cls(self._host, self._port, timeout=self._timeout)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        self._conn.request(method, self._base + path, body=body, headers=headers)
+        response = self._conn.getresponse()
+        data = response.read()
+        if response.status != 200:
+            raise http.client.HTTPException(f"{method} {path} returned {response.status}")
+        return json.loads(data)
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,169 @@
+# src/daily_task_planner/sync/sync_server.py
+"""
+Reference sync server for local testing.
+
+    python -m daily_task_planner.sync.sync_server --port 8765
+
+POST /push  {"replica": id, "changes": [...]}  -> {"seq": n}
+GET  /pull?since=n                              -> {"seq": n, "changes": [...]}
+
+Fields are merged with the same version-vector rules as the clients. Every
+accepted change gets a new sequence number, and pulls only walk the changes
+newer than `since`. With --data, accepted changes are appended to a journal
+rather than rewriting the whole store on every push.
+"""
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+import argparse
+import json
+import threading
+
+from daily_task_planner.sync.delta import merge_entry
+from daily_task_planner.sync.journal import Journal
+
+
+class SyncStore:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.seq = 0
+        # (key, field) -> {"value", "vv", "seq"}, kept in ascending seq order
+        self._entries: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._journal = Journal(self.path) if self.path else None
+        self.load()
+
+    def push(self, changes: Iterable[dict]) -> int:
+        with self._lock:
+            accepted = []
+            for change in changes:
+                slot = (change["key"], change["field"])
+                entry = self._entries.get(slot)
+                winner = merge_entry(entry, {"value": change["value"], "vv": change["vv"]})
+                if winner is entry:
+                    continue
+                self.seq += 1
+                self._entries[slot] = {"value": winner["value"], "vv": winner["vv"], "seq": self.seq}
+                self._entries.move_to_end(slot)
+                accepted.append({"key": slot[0], "field": slot[1], **self._entries[slot]})
+            if accepted:
+                self.save(accepted)
+            return self.seq
+
+    def pull(self, since: int) -> Tuple[int, List[dict]]:
+        with self._lock:
+            newer = []
+            for (key, field_name), entry in reversed(self._entries.items()):
+                if entry["seq"] <= since:
+                    break
+                newer.append({"key": key, "field": field_name, **entry})
+            newer.reverse()
+            return self.seq, newer
+
+    # --- Persistence ---
+    def save(self, accepted: List[dict]):
+        """Journal the entries accepted by a push."""
+        if self._journal is None:
+            return
+        try:
+            self._journal.write(accepted, self._snapshot, len(self._entries))
+        except Exception as e:
+            print(f"[WARN] Could not save sync store: {e}")
+
+    def _snapshot(self) -> dict:
+        return {
+            "seq": self.seq,
+            "entries": [{"key": k, "field": f, **e} for (k, f), e in self._entries.items()],
+        }
+
+    def load(self):
+        if self._journal is None:
+            return
+        try:
+            payload, logged = self._journal.load()
+            self.seq = (payload or {}).get("seq", 0)
+            for e in (payload or {}).get("entries", []) + logged:
+                slot = (e["key"], e["field"])
+                entry = self._entries.get(slot)
+                if entry is not None and entry["seq"] >= e["seq"]:
+                    continue  # already in the snapshot
+                self._entries[slot] = {"value": e["value"], "vv": e["vv"], "seq": e["seq"]}
+                self._entries.move_to_end(slot)
+                self.seq = max(self.seq, e["seq"])
+        except Exception as e:
+            print(f"[WARN] Could not load sync store: {e}")
+
+
+class SyncRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so clients reuse one connection
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path != "/pull":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            since = int(parse_qs(url.query).get("since", ["0"])[0])
+        except ValueError:
+            self._send(400, {"error": "bad since"})
+            return
+        seq, changes = self.server.store.pull(since)
+        self._send(200, {"seq": seq, "changes": changes})
+
+    def do_POST(self):
+        if urlsplit(self.path).path != "/push":
+            self._send(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            seq = self.server.store.push(body.get("changes", []))
+        except (ValueError, KeyError, TypeError) as e:
+            self._send(400, {"error": str(e)})
+            return
+        self._send(200, {"seq": seq})
+
+    def _send(self, status: int, payload: dict):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(host: str = "127.0.0.1", port: int = 8765, store: Optional[SyncStore] = None,
+                verbose: bool = False) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), SyncRequestHandler)
+    server.daemon_threads = True
+    server.store = store or SyncStore()
+    server.verbose = verbose
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Daily Task Planner reference sync server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--data", type=Path, help="persist the store to this file")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log requests")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port, SyncStore(args.data), args.verbose)
+    print(f"Sync server listening on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# src/daily_task_planner/sync/sync_service.py
+from pathlib import Path
+from typing import Optional
+import queue
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from daily_task_planner.model.task_model import UnifiedModel, HISTORY, record_key
+from daily_task_planner.sync.delta import DAY_KINDS, SYNCED_KINDS, SyncState, today_key
+from daily_task_planner.sync.sync_client import SyncClient
+
+
+class SyncService(QObject):
+    """
+    Connects a UnifiedModel to a sync server.
+
+    Model changes mark the records they touched dirty; after a short quiet
+    period those records are diffed into field deltas and handed to the
+    background client. Pulled changes are merged and patched into the model
+    on the UI thread, as one commit. Changes the server hasn't acknowledged
+    are kept in the sync state and pushed again on start.
+    """
+    remote_applied = Signal(set)  # entity keys changed by the server ("<kind>:*" after a new day)
+    tasks_changed = Signal(set)   # ids of tasks whose fields or deliverables the server changed
+
+    STATE_PATH = Path.home() / ".daily_task_planner_sync.json"
+
+    def __init__(self, model: UnifiedModel, url: str, state_path: Optional[Path] = None,
+                 push_delay_ms: int = 1500, poll_interval: float = 5.0, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self.state = SyncState(state_path or self.STATE_PATH)
+        self.client = SyncClient(url, self.state.replica_id, self.state.since, poll_interval)
+
+        # Diff everything once on start, then only the records that change
+        self._dirty = {record_key(kind) for kind in SYNCED_KINDS}
+        self._applying = False
+        self._day_changed = False
+        model.add_listener(self._on_model_changed)
+
+        self._push_timer = QTimer(self)
+        self._push_timer.setSingleShot(True)
+        self._push_timer.setInterval(push_delay_ms)
+        self._push_timer.timeout.connect(self.flush)
+
+        self._inbox_timer = QTimer(self)
+        self._inbox_timer.setInterval(250)
+        self._inbox_timer.timeout.connect(self.apply_incoming)
+
+    def start(self):
+        pending = self.state.pending()
+        if pending:
+            self.client.push(pending)
+        self.flush()
+        self.client.start()
+        self.client.sync_now()
+        self._inbox_timer.start()
+
+    def stop(self):
+        self._inbox_timer.stop()
+        self.flush()
+        self.client.stop()
+        self.model.remove_listener(self._on_model_changed)
+        self.state.save()
+
+    def flush(self):
+        """Diff dirty records against the synced state and queue the deltas."""
+        self._push_timer.stop()
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        changes = self.state.record_local(self.model, dirty)
+        if changes:
+            self.client.push(changes)
+            self.state.save()
+
+    def apply_incoming(self):
+        results = []
+        while True:
+            try:
+                results.append(self.client.inbox.get_nowait())
+            except queue.Empty:
+                break
+        if not results and not self._day_changed:
+            return
+
+        # Start the new day before applying anything pulled, so another
+        # replica's new-day entities never land in (and get archived with)
+        # a stale day
+        self.model.rollover_day()
+
+        # Local edits must be in the state before remote ones are merged over them
+        self.flush()
+        keys = set()
+        if self._day_changed:
+            # Entities of the new day may have arrived before the rollover
+            keys |= {record_key(kind) for kind in DAY_KINDS}
+            keys.add(today_key(self.model.today.date))
+            self._day_changed = False
+        for result in results:
+            if "acked" in result:
+                self.state.ack(result["acked"])
+                continue
+            keys |= self.state.merge_remote(result["changes"])
+            self.state.since = max(self.state.since, result["seq"])
+        if keys:
+            self._applying = True
+            try:
+                changed = self.state.apply_to_model(self.model, keys)
+            finally:
+                self._applying = False
+            self.remote_applied.emit(keys)
+            task_ids = {key.partition(":")[2] for key in changed if key.startswith("task:")}
+            if task_ids:
+                self.tasks_changed.emit(task_ids)
+        self.state.save()
+
+    def _on_model_changed(self, changes):
+        if HISTORY in changes:
+            self._day_changed = True
+        if self._applying:
+            return
+        dirty = {key for key in changes if key.partition(":")[0] in SYNCED_KINDS}
+        if dirty:
+            self._dirty |= dirty
+            self._push_timer.start()
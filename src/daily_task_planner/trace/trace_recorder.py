@@ -0,0 +1,98 @@
+# src/daily_task_planner/trace/trace_recorder.py
+"""
+Records presenter-level operations to a JSON-lines trace file.
+
+The first line is a header holding a snapshot of the model when recording
+started; every following line is one presenter call:
+
+    {"t": 1.25, "target": "today", "op": "add_task", "args": ["Write report"]}
+
+Calls that create a task also record its id as "created", so the replay
+tool can map later references to the task it creates itself.
+"""
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from time import perf_counter
+import json
+
+from daily_task_planner.model.task_model import UnifiedModel
+
+TRACE_VERSION = 1
+
+# Presenter methods driven by user actions. Periodic housekeeping such as
+# check_rollover is left out so idle time doesn't flood the trace.
+TRACED_METHODS = {
+    "today": (
+        "add_task", "edit_task", "set_task_complete", "reorder_tasks", "delete_task",
+        "complete_all_tasks", "clear_completed_tasks", "set_task_priority", "set_task_tags",
+        "add_meeting", "remove_meeting", "update_notes",
+    ),
+    "tasks": (
+        "add_task", "remove_task", "update_title", "update_user_story", "update_notes",
+        "add_deliverable", "set_deliverable_complete", "reorder_deliverables",
+        "complete_all_deliverables", "clear_completed_deliverables", "remove_deliverable",
+        "set_priority", "set_tags", "set_deliverable_priority", "set_deliverable_tags",
+    ),
+}
+
+
+class TraceRecorder:
+    def __init__(self, path, model: UnifiedModel):
+        self.path = Path(path)
+        self.model = model
+        self._file = None
+        self._start = 0.0
+        self._depth = 0  # only the outermost presenter call is recorded
+
+    def traced(self, presenter_cls, target: str):
+        """
+        Subclass of `presenter_cls` whose user-facing methods are recorded.
+        Instantiate it in place of the presenter so the view's signal
+        connections go through the recording wrappers.
+        """
+        namespace = {
+            name: self._wrap(getattr(presenter_cls, name), target, name)
+            for name in TRACED_METHODS[target]
+        }
+        return type(f"Traced{presenter_cls.__name__}", (presenter_cls,), namespace)
+
+    def start(self):
+        """Open the trace and write the header with the current model state."""
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        # Line-buffered, so a crash or kill loses at most the call in progress
+        self._file = open(self.path, "w", encoding="utf-8", buffering=1)
+        header = {
+            "type": "header",
+            "version": TRACE_VERSION,
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "snapshot": self.model.to_payload(),
+        }
+        self._file.write(json.dumps(header) + "\n")
+        self._start = perf_counter()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _wrap(self, method, target, name):
+        recorder = self
+
+        @wraps(method)
+        def wrapper(presenter, *args):
+            if recorder._file is None or recorder._depth:
+                return method(presenter, *args)
+            t = perf_counter() - recorder._start
+            task_count = len(recorder.model.tasks)
+            recorder._depth += 1
+            try:
+                return method(presenter, *args)
+            finally:
+                recorder._depth -= 1
+                entry = {"t": round(t, 6), "target": target, "op": name, "args": list(args)}
+                if len(recorder.model.tasks) > task_count:
+                    entry["created"] = recorder.model.tasks[-1].id
+                recorder._file.write(json.dumps(entry) + "\n")
+
+        return wrapper
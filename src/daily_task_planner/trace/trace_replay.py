@@ -0,0 +1,118 @@
+# src/daily_task_planner/trace/trace_replay.py
+"""
+Replays a recorded trace headlessly against a fresh model and views and
+reports per-operation latency.
+
+    python -m daily_task_planner.trace.trace_replay session.jsonl --speed max
+"""
+from datetime import date
+from pathlib import Path
+from statistics import mean
+from time import perf_counter, sleep
+from typing import Dict, List
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+# Arguments holding a task id, by (target, op) -> argument position. Recorded
+# ids differ from the ones created during replay, so only these are mapped.
+TASK_ID_ARGS = {("tasks", "remove_task"): 0}
+
+
+def read_trace(path):
+    """Yield the header, then each recorded operation."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def replay_args(entry: dict, ids: Dict[str, str]) -> list:
+    """Arguments of `entry`, with recorded task ids swapped for replayed ones."""
+    args = list(entry["args"])
+    position = TASK_ID_ARGS.get((entry["target"], entry["op"]))
+    if position is not None and position < len(args):
+        args[position] = ids.get(args[position], args[position])
+    return args
+
+
+def replay(path, speed: str = "max") -> Dict[str, List[float]]:
+    """Replay `path`; returns the latencies (seconds) of each "target.op"."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    from daily_task_planner.model.task_model import UnifiedModel
+    from daily_task_planner.presenter.today_presenter import TodayPresenter
+    from daily_task_planner.presenter.tasks_presenter import TasksPresenter
+    from daily_task_planner.view.tasks_pane import TasksPane
+    from daily_task_planner.view.today_pane import TodayPane
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    entries = read_trace(path)
+    header = next(entries)
+    if header.get("type") != "header":
+        raise ValueError(f"{path} does not start with a trace header")
+
+    latencies: Dict[str, List[float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # Start from the recorded state, dated today so it doesn't roll over
+        snapshot = header["snapshot"]
+        snapshot.setdefault("today", {})["date"] = date.today().isoformat()
+        data_path = Path(tmp) / "planner.json"
+        data_path.write_text(json.dumps(snapshot), encoding="utf-8")
+
+        model = UnifiedModel(data_path)
+        presenters = {
+            "today": TodayPresenter(TodayPane(model.today.tasks), model),
+            "tasks": TasksPresenter(TasksPane(), model),
+        }
+        ids = {}  # recorded task id -> id created during replay
+        start = perf_counter()
+        for entry in entries:
+            if speed == "original":
+                while perf_counter() - start < entry["t"]:
+                    app.processEvents()
+                    sleep(0.001)
+            args = replay_args(entry, ids)
+            method = getattr(presenters[entry["target"]], entry["op"])
+
+            t0 = perf_counter()
+            method(*args)
+            elapsed = perf_counter() - t0
+
+            latencies.setdefault(f"{entry['target']}.{entry['op']}", []).append(elapsed)
+            if "created" in entry:
+                ids[entry["created"]] = model.tasks[-1].id
+            app.processEvents()
+    return latencies
+
+
+def format_report(latencies: Dict[str, List[float]]) -> str:
+    lines = [f"{'operation':<40}{'count':>7}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+    for op, values in sorted(latencies.items(), key=lambda kv: -sum(kv[1])):
+        ordered = sorted(values)
+        lines.append(
+            f"{op:<40}{len(values):>7}{mean(values) * 1000:>10.2f}"
+            f"{_percentile(ordered, 50) * 1000:>10.2f}{_percentile(ordered, 95) * 1000:>10.2f}"
+            f"{ordered[-1] * 1000:>10.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a Daily Task Planner operation trace.")
+    parser.add_argument("trace", type=Path)
+    parser.add_argument("--speed", choices=("max", "original"), default="max",
+                        help="replay as fast as possible or with the recorded timing")
+    args = parser.parse_args(argv)
+    print(format_report(replay(args.trace, args.speed)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+# src/daily_task_planner/view/check_list.py
+from functools import partial
+
+from PySide6.QtWidgets import QAbstractItemView, QInputDialog, QListView
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractListModel, QModelIndex, QSortFilterProxyModel,
+)
+from daily_task_planner.model.record_index import PRIORITIES
+
+COMPLETE_ROLE = Qt.UserRole.value
+ID_ROLE = Qt.UserRole.value + 1
+PRIORITY_ROLE = Qt.UserRole.value + 2
+TAGS_ROLE = Qt.UserRole.value + 3
+
+# data() runs per row on every filter/sort pass; compare plain ints rather
+# than enum members to keep it cheap on long lists
+_DISPLAY_ROLE = Qt.DisplayRole.value
+_EDIT_ROLE = Qt.EditRole.value
+_CHECK_STATE_ROLE = Qt.CheckStateRole.value
+
+
+class CheckListModel(QAbstractListModel):
+    """
+    List model of checkable (description, complete) rows. Rows also carry
+    the record id, priority and tags; the latter two are shown after the
+    description. Emits source-row based signals when the user checks or
+    edits a row.
+    """
+    item_checked = Signal(int, bool)  # (row, complete)
+    item_edited = Signal(int, str)    # (row, description)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def set_items(self, items):
+        """
+        Load rows from model data (Task or Deliverable records). Only what
+        differs is signalled: added or removed rows as inserts/removals and
+        edited rows as dataChanged, so the proxy re-filters and re-sorts just
+        those rows and selection and scroll survive.
+        """
+        rows = [[i.description, i.complete, i.id, i.priority, list(i.tags)] for i in items]
+        old = self._rows
+        if rows == old:
+            return
+
+        # Rows whose ids match at both ends are kept; the ones in between
+        # are replaced, which covers a run of added or removed rows
+        shorter = min(len(old), len(rows))
+        start = 0
+        while start < shorter and old[start][2] == rows[start][2]:
+            start += 1
+        end = 0
+        while end < shorter - start and old[-1 - end][2] == rows[-1 - end][2]:
+            end += 1
+        removed, added = len(old) - start - end, len(rows) - start - end
+        if removed != added:
+            if removed:
+                self.beginRemoveRows(QModelIndex(), start, start + removed - 1)
+                del old[start:start + removed]
+                self.endRemoveRows()
+            if added:
+                self.beginInsertRows(QModelIndex(), start, start + added - 1)
+                old[start:start] = rows[start:start + added]
+                self.endInsertRows()
+
+        # One row at a time: the proxy re-sorts a changed row against its
+        # neighbours, so those must not have changed yet
+        for r in [r for r in range(len(rows)) if old[r] != rows[r]]:
+            old[r] = rows[r]
+            index = self.index(r)
+            self.dataChanged.emit(index, index)
+
+    def items(self):
+        return [(row[0], row[1]) for row in self._rows]
+
+    def move_row(self, from_row: int, to_row: int):
+        """Move a row so it ends up at `to_row` (pop/insert semantics)."""
+        if from_row == to_row:
+            return
+        dest = to_row + 1 if to_row > from_row else to_row
+        self.beginMoveRows(QModelIndex(), from_row, from_row, QModelIndex(), dest)
+        self._rows.insert(to_row, self._rows.pop(from_row))
+        self.endMoveRows()
+
+    # --- QAbstractListModel interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        desc, complete, record_id, priority, tags = self._rows[index.row()]
+        if role == COMPLETE_ROLE:
+            return complete
+        if role == _DISPLAY_ROLE:
+            return _label(desc, priority, tags)
+        if role == _EDIT_ROLE:
+            return desc
+        if role == _CHECK_STATE_ROLE:
+            return Qt.Checked if complete else Qt.Unchecked
+        if role == ID_ROLE:
+            return record_id
+        if role == PRIORITY_ROLE:
+            return priority
+        if role == TAGS_ROLE:
+            return tags
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = index.row()
+        if role == Qt.CheckStateRole:
+            complete = Qt.CheckState(value) == Qt.Checked
+            self._rows[row][1] = complete
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole, COMPLETE_ROLE])
+            self.item_checked.emit(row, complete)
+            return True
+        if role == Qt.EditRole:
+            text = str(value).strip()
+            if not text:
+                return False
+            self._rows[row][0] = text
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            self.item_edited.emit(row, text)
+            return True
+        return False
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return (
+            Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+            | Qt.ItemIsEditable | Qt.ItemIsDragEnabled
+        )
+
+    def supportedDropActions(self):
+        return Qt.MoveAction | Qt.CopyAction
+
+
+def _label(desc, priority, tags):
+    suffix = [f"[{priority}]"] if priority != "normal" else []
+    suffix.extend(f"#{tag}" for tag in tags)
+    return f"{desc}  {' '.join(suffix)}" if suffix else desc
+
+
+class CheckListFilterProxy(QSortFilterProxyModel):
+    """
+    Text filter plus "hide completed" and "incomplete first" views, and an
+    optional set of record ids (the result of a tag/priority query).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = None
+        self._filter_text = ""
+        self._hide_completed = False
+        self._incomplete_first = False
+        self._allowed_ids = None
+        self.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+    def setSourceModel(self, model):
+        # filterAcceptsRow/lessThan run once per row or comparison; they read
+        # the CheckListModel rows directly rather than going through data()
+        self._source = model
+        super().setSourceModel(model)
+
+    def set_filter_text(self, text: str):
+        self._filter_text = text
+        self.setFilterFixedString(text)
+
+    def set_hide_completed(self, hide: bool):
+        self._hide_completed = hide
+        self.invalidateFilter()
+
+    def set_incomplete_first(self, enabled: bool):
+        self._incomplete_first = enabled
+        # Column -1 restores the source order
+        self.sort(0 if enabled else -1)
+
+    def set_allowed_ids(self, ids):
+        """Only show rows whose id is in `ids`; None shows all rows."""
+        self._allowed_ids = ids
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        _, complete, record_id, _, _ = self._source._rows[source_row]
+        if self._hide_completed and complete:
+            return False
+        if self._allowed_ids is not None and record_id not in self._allowed_ids:
+            return False
+        return not self._filter_text or super().filterAcceptsRow(source_row, source_parent)
+
+    def lessThan(self, left, right):
+        # Incomplete rows first, in model order within each group. Ties are
+        # broken by row because changed rows are re-inserted by binary search,
+        # which doesn't keep the order of equal rows
+        rows = self._source._rows
+        left_row, right_row = left.row(), right.row()
+        return (rows[left_row][1], left_row) < (rows[right_row][1], right_row)
+
+
+class CheckListView(QListView):
+    """
+    QListView over a CheckListModel through a CheckListFilterProxy.
+    Drag reordering works in filtered/sorted views; moves are mapped back
+    to source rows and emitted as (from_row, to_row).
+    """
+    row_moved = Signal(int, int)
+    priority_set = Signal(int, str)  # (row, priority)
+    tags_set = Signal(int, list)     # (row, tags)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.source_model = CheckListModel(self)
+        self.proxy = CheckListFilterProxy(self)
+        self.proxy.setSourceModel(self.source_model)
+        self.setModel(self.proxy)
+
+        self.setUniformItemSizes(True)
+        self.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+        self.setDragDropMode(QAbstractItemView.InternalMove)
+        self.setDefaultDropAction(Qt.MoveAction)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.setDropIndicatorShown(True)
+
+    def populate(self, items):
+        self.source_model.set_items(items)
+
+    def source_row_at(self, pos) -> int:
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return -1
+        return self.proxy.mapToSource(index).row()
+
+    def add_record_actions(self, menu, row: int):
+        """
+        Add a Priority submenu and "Edit Tags..." for source `row` to a
+        context menu; choices are emitted as priority_set / tags_set.
+        """
+        index = self.source_model.index(row)
+        priority_menu = menu.addMenu("Priority")
+        for priority in PRIORITIES:
+            action = priority_menu.addAction(priority.capitalize())
+            action.setCheckable(True)
+            action.setChecked(index.data(PRIORITY_ROLE) == priority)
+            action.triggered.connect(partial(self.priority_set.emit, row, priority))
+        tags_action = menu.addAction("Edit Tags...")
+        tags_action.triggered.connect(partial(self._edit_tags, row))
+
+    def _edit_tags(self, row):
+        current = " ".join(f"#{tag}" for tag in self.source_model.index(row).data(TAGS_ROLE))
+        text, ok = QInputDialog.getText(self, "Edit Tags", "Tags (space or comma separated):", text=current)
+        if ok:
+            self.tags_set.emit(row, text.replace(",", " ").split())
+
+    def dropEvent(self, event):
+        selected = self.selectionModel().selectedIndexes()
+        if event.source() is not self or not selected:
+            event.ignore()
+            return
+        from_row = self.proxy.mapToSource(selected[0]).row()
+
+        # Insertion point in proxy rows, then in source rows
+        target = self.indexAt(event.position().toPoint())
+        position = self.dropIndicatorPosition()
+        if not target.isValid() or position == QAbstractItemView.OnViewport:
+            proxy_row = self.proxy.rowCount()
+        elif position == QAbstractItemView.BelowItem:
+            proxy_row = target.row() + 1
+        else:
+            proxy_row = target.row()
+
+        # Copy action so the base class doesn't also remove the dragged row
+        event.setDropAction(Qt.CopyAction)
+        event.accept()
+        self.drop_row(from_row, proxy_row)
+
+    def drop_row(self, from_row: int, proxy_row: int):
+        """
+        Move source row `from_row` to just before what is shown at
+        `proxy_row` (the end for rowCount()) and emit row_moved.
+        """
+        if proxy_row < self.proxy.rowCount():
+            insert_at = self.proxy.mapToSource(self.proxy.index(proxy_row, 0)).row()
+        elif self.proxy.rowCount():
+            last = self.proxy.index(self.proxy.rowCount() - 1, 0)
+            insert_at = self.proxy.mapToSource(last).row() + 1
+        else:
+            insert_at = self.source_model.rowCount()
+        to_row = insert_at - 1 if insert_at > from_row else insert_at
+
+        if to_row != from_row:
+            self.source_model.move_row(from_row, to_row)
+            self.row_moved.emit(from_row, to_row)
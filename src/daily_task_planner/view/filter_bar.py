@@ -0,0 +1,57 @@
+# src/daily_task_planner/view/filter_bar.py
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QLineEdit, QCheckBox
+from PySide6.QtCore import Signal
+
+QUERY_HINT = "Query, e.g. priority:high #release not complete"
+
+
+class FilterBar(QWidget):
+    """
+    Filter text and view toggles bound to a CheckListFilterProxy, plus a
+    tag/priority query that the presenter evaluates against the model.
+    """
+    query_changed = Signal(str)
+
+    def __init__(self, proxy, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.proxy = proxy
+
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter...")
+        self.filter_input.setClearButtonEnabled(True)
+        self.hide_completed_box = QCheckBox("Hide completed")
+        self.incomplete_first_box = QCheckBox("Incomplete first")
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText(QUERY_HINT)
+        self.query_input.setClearButtonEnabled(True)
+
+        layout.addWidget(self.filter_input, 1)
+        layout.addWidget(self.query_input, 1)
+        layout.addWidget(self.hide_completed_box)
+        layout.addWidget(self.incomplete_first_box)
+
+        self.filter_input.textChanged.connect(self._on_filter_text)
+        self.hide_completed_box.toggled.connect(self._on_hide_completed)
+        self.incomplete_first_box.toggled.connect(self._on_incomplete_first)
+        self.query_input.textChanged.connect(self.query_changed)
+
+    # Slots on this widget rather than direct connections to the proxy:
+    # PySide keeps a small per-connection record for cross-object slots
+    # that is never freed when the widgets are deleted
+    def _on_filter_text(self, text):
+        self.proxy.set_filter_text(text)
+
+    def _on_hide_completed(self, hide):
+        self.proxy.set_hide_completed(hide)
+
+    def _on_incomplete_first(self, enabled):
+        self.proxy.set_incomplete_first(enabled)
+
+    def show_query_result(self, ids, error: str = ""):
+        """Limit the list to `ids` (None for no query) and flag a bad query."""
+        self.query_input.setStyleSheet("border: 1px solid #c0392b;" if error else "")
+        self.query_input.setToolTip(error or QUERY_HINT)
+        if not error:
+            self.proxy.set_allowed_ids(ids)
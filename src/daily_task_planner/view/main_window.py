@@ -1,7 +1,9 @@
-from PySide6.QtWidgets import QMainWindow, QSplitter 
+from PySide6.QtWidgets import QMainWindow, QSplitter, QFileDialog, QMessageBox
 from PySide6.QtCore import Qt, QEvent, QTimer 
 import json 
+import os
 from pathlib import Path
+from daily_task_planner.report import report_generator
 
 class MainWindow(QMainWindow):
     STORAGE_PATH = Path.home() / ".daily_task_planner_window.json"
@@ -9,6 +11,7 @@ class MainWindow(QMainWindow):
     def __init__(self, today_presenter, tasks_presenter):
         super().__init__()
         self.setWindowTitle("Daily Task Planner")
+        self.model = today_presenter.model
 
         # --- Splitter setup ---
         self.splitter = QSplitter(Qt.Horizontal)
@@ -20,6 +23,19 @@ class MainWindow(QMainWindow):
         self.splitter.splitterMoved.connect(self._on_splitter_moved)
         self._cached_splitter_sizes = []
 
+        # --- Menus ---
+        reports_menu = self.menuBar().addMenu("&Reports")
+        reports_menu.addAction("Export &Daily Report...", lambda: self._export_report("day"))
+        reports_menu.addAction("Export &Weekly Report...", lambda: self._export_report("week"))
+        reports_menu.addAction("Export &Full History...", lambda: self._export_report("all"))
+        options_menu = self.menuBar().addMenu("&Options")
+        self.carry_action = options_menu.addAction("&Carry Undone Deliverables Into New Days")
+        self.carry_action.setCheckable(True)
+        self.carry_action.setChecked(self.model.carry_deliverables)
+        self.carry_action.toggled.connect(self.model.set_carry_deliverables)
+        if os.environ.get("DAILY_TASK_PLANNER_DEBUG"):
+            self._build_debug_menu()
+
         # --- Load window state ---
         self._load_window_state()
 
@@ -42,6 +58,51 @@ class MainWindow(QMainWindow):
         self._save_window_state()
         super().closeEvent(event)
 
+    # Reports
+    def _export_report(self, period):
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Report", str(Path.home() / f"planner-{period}.md"),
+            "Markdown (*.md);;HTML (*.html)",
+        )
+        if not path:
+            return
+        default = "html" if selected_filter.startswith("HTML") else "markdown"
+        fmt = report_generator.format_for_path(path, default)
+        try:
+            report_generator.write_report(report_generator.generate(self.model, period, fmt), path)
+        except OSError as e:
+            QMessageBox.warning(self, "Export Report", f"Could not write report: {e}")
+
+    # Debug diagnostics (enabled with DAILY_TASK_PLANNER_DEBUG=1)
+    def _build_debug_menu(self):
+        from daily_task_planner.diagnostics.memory_tracker import MemoryTracker
+        self._memory_tracker = MemoryTracker()
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.timeout.connect(self._memory_tracker.snapshot)
+
+        debug_menu = self.menuBar().addMenu("&Debug")
+        debug_menu.addAction("&Memory Report...", self._show_memory_report)
+        debug_menu.addAction("Take &Snapshot", self._memory_tracker.snapshot)
+        debug_menu.addAction("&Reset Baseline", self._memory_tracker.start)
+        periodic = debug_menu.addAction("&Periodic Snapshots")
+        periodic.setCheckable(True)
+        periodic.toggled.connect(self._toggle_periodic_snapshots)
+
+    def _toggle_periodic_snapshots(self, enabled):
+        if enabled:
+            if not self._memory_tracker.running:
+                self._memory_tracker.start()
+            self._snapshot_timer.start(5 * 60_000)
+        else:
+            self._snapshot_timer.stop()
+
+    def _show_memory_report(self):
+        box = QMessageBox(self)
+        box.setWindowTitle("Memory Report")
+        box.setText("Live object counts and allocation growth since the baseline.")
+        box.setDetailedText(self._memory_tracker.report())
+        box.exec()
+
     # Persistence
     def _save_window_state(self):
         payload = {
@@ -1,10 +1,12 @@
 # src/daily_task_planner/view/tasks_pane.py
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QTabWidget,
-    QPushButton, QLineEdit, QTextEdit, QMenu, QListWidgetItem
+    QPushButton, QLineEdit, QTextEdit, QMenu, QComboBox, QLabel
 )
 from PySide6.QtCore import Qt, Signal
 from daily_task_planner.view.deliverables_list import DeliverablesList
+from daily_task_planner.view.filter_bar import FilterBar, QUERY_HINT
+from daily_task_planner.model.record_index import PRIORITIES
 
 
 class TaskTab(QWidget):
@@ -15,20 +17,39 @@ class TaskTab(QWidget):
     deliverable_changed = Signal(int, str)
     deliverable_checked = Signal(int, bool)
     deliverable_deleted = Signal(int)
-    deliverables_reordered = Signal(int, list)
+    deliverables_reordered = Signal(int, int)  # (old_index, new_index)
+    complete_all_deliverables_requested = Signal()
+    clear_completed_deliverables_requested = Signal()
     notes_changed = Signal(str)
+    priority_changed = Signal(str)
+    tags_changed = Signal(list)
+    deliverable_priority_changed = Signal(int, str)
+    deliverable_tags_changed = Signal(int, list)
+    deliverables_query_changed = Signal(str)
 
-    def __init__(self, task_data, task_index=None):
+    def __init__(self, task_data):
         super().__init__()
         layout = QVBoxLayout(self)
-        self._task_index = task_index
-        self._editing_index = None
+        self.task_id = task_data.id
 
         # --- Title ---
         self.title_box = QLineEdit(task_data.title)
         self.title_box.setStyleSheet("font-weight: bold; font-size: 16px;")
         layout.addWidget(self.title_box)
 
+        # --- Priority / Tags ---
+        meta_layout = QHBoxLayout()
+        self.priority_box = QComboBox()
+        self.priority_box.addItems(PRIORITIES)
+        self.priority_box.setCurrentText(task_data.priority)
+        self.tags_input = QLineEdit(_tags_text(task_data.tags))
+        self.tags_input.setPlaceholderText("Tags, e.g. #release #ui")
+        meta_layout.addWidget(QLabel("Priority:"))
+        meta_layout.addWidget(self.priority_box)
+        meta_layout.addWidget(QLabel("Tags:"))
+        meta_layout.addWidget(self.tags_input, 1)
+        layout.addLayout(meta_layout)
+
         # --- User Story ---
         story_group = QGroupBox("User Story")
         story_layout = QVBoxLayout()
@@ -41,12 +62,14 @@ class TaskTab(QWidget):
         deliverables_group = QGroupBox("Deliverables")
         deliverables_layout = QVBoxLayout()
 
-        self.deliverables_list = DeliverablesList(task_index=self._task_index)
-        self.deliverables_list.reordered.connect(self.deliverables_reordered)
+        self.deliverables_list = DeliverablesList()
+        self.deliverables_list.row_moved.connect(self.deliverables_reordered)
+        self.deliverables_filter = FilterBar(self.deliverables_list.proxy)
 
         self.deliverable_input = QLineEdit()
         self.deliverable_input.setPlaceholderText("Add a new deliverable and press Enter")
 
+        deliverables_layout.addWidget(self.deliverables_filter)
         deliverables_layout.addWidget(self.deliverables_list)
         deliverables_layout.addWidget(self.deliverable_input)
         deliverables_group.setLayout(deliverables_layout)
@@ -63,13 +86,17 @@ class TaskTab(QWidget):
 
         # Connect signals
         self.title_box.textChanged.connect(self.title_changed)
-        self.story_text.textChanged.connect(lambda: self.user_story_changed.emit(self.story_text.toPlainText()))
-        self.notes_text.textChanged.connect(lambda: self.notes_changed.emit(self.notes_text.toPlainText()))
+        self.story_text.textChanged.connect(self._on_story_changed)
+        self.notes_text.textChanged.connect(self._on_notes_changed)
         self.deliverable_input.returnPressed.connect(self._on_add_deliverable)
-
-        self.deliverables_list.itemChanged.connect(self._on_deliverable_checked)
-        self.deliverables_list.itemDoubleClicked.connect(self._on_edit_deliverable)
-        self.deliverables_list.itemChanged.connect(self._on_deliverable_changed)
+        self.priority_box.currentTextChanged.connect(self.priority_changed)
+        self.tags_input.editingFinished.connect(self._on_tags_edited)
+
+        self.deliverables_list.source_model.item_checked.connect(self.deliverable_checked)
+        self.deliverables_list.source_model.item_edited.connect(self.deliverable_changed)
+        self.deliverables_list.priority_set.connect(self.deliverable_priority_changed)
+        self.deliverables_list.tags_set.connect(self.deliverable_tags_changed)
+        self.deliverables_filter.query_changed.connect(self.deliverables_query_changed)
         self.deliverables_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.deliverables_list.customContextMenuRequested.connect(self._on_deliverable_context_menu)
 
@@ -78,48 +105,83 @@ class TaskTab(QWidget):
     def populate_deliverables(self, deliverables):
         self.deliverables_list.populate(deliverables)
 
+    def update_from(self, task_data):
+        """Show changed task data without echoing it back as user edits."""
+        for widget, text in (
+            (self.title_box, task_data.title),
+            (self.story_text, task_data.user_story),
+            (self.notes_text, task_data.notes),
+        ):
+            current = widget.text() if widget is self.title_box else widget.toPlainText()
+            if current != text:
+                widget.blockSignals(True)
+                if widget is self.title_box:
+                    widget.setText(text)
+                else:
+                    widget.setPlainText(text)
+                widget.blockSignals(False)
+        if self.priority_box.currentText() != task_data.priority:
+            self.priority_box.blockSignals(True)
+            self.priority_box.setCurrentText(task_data.priority)
+            self.priority_box.blockSignals(False)
+        if not self.tags_input.hasFocus():
+            self.tags_input.setText(_tags_text(task_data.tags))
+        self.populate_deliverables(task_data.deliverables)
+
+    def _on_story_changed(self):
+        self.user_story_changed.emit(self.story_text.toPlainText())
+
+    def _on_notes_changed(self):
+        self.notes_changed.emit(self.notes_text.toPlainText())
+
+    def _on_tags_edited(self):
+        self.tags_changed.emit(self.tags_input.text().replace(",", " ").split())
+
     def _on_add_deliverable(self):
         text = self.deliverable_input.text().strip()
         if text:
             self.deliverable_added.emit(text)
             self.deliverable_input.clear()
 
-    def _on_deliverable_checked(self, item):
-        idx = self.deliverables_list.row(item)
-        checked = item.checkState() == Qt.Checked
-        self.deliverable_checked.emit(idx, checked)
-
-    def _on_edit_deliverable(self, item):
-        self._editing_index = self.deliverables_list.row(item)
-        self.deliverables_list.editItem(item)
-
-    def _on_deliverable_changed(self, item):
-        idx = self.deliverables_list.row(item)
-        if idx == self._editing_index:
-            self.deliverable_changed.emit(idx, item.text())
-            self._editing_index = None
-
     def _on_deliverable_context_menu(self, pos):
-        item = self.deliverables_list.itemAt(pos)
-        if item is None:
-            return
+        row = self.deliverables_list.source_row_at(pos)
         menu = QMenu()
-        delete_action = menu.addAction("Delete")
+        delete_action = menu.addAction("Delete") if row >= 0 else None
+        if row >= 0:
+            self.deliverables_list.add_record_actions(menu, row)
+        menu.addSeparator()
+        complete_all_action = menu.addAction("Mark All Complete")
+        clear_completed_action = menu.addAction("Clear Completed")
         action = menu.exec(self.deliverables_list.mapToGlobal(pos))
+        if action is None:
+            return
         if action == delete_action:
-            index = self.deliverables_list.row(item)
-            self.deliverable_deleted.emit(index)
+            self.deliverable_deleted.emit(row)
+        elif action == complete_all_action:
+            self.complete_all_deliverables_requested.emit()
+        elif action == clear_completed_action:
+            self.clear_completed_deliverables_requested.emit()
+
+
+def _tags_text(tags):
+    return " ".join(f"#{tag}" for tag in tags)
 
 
 class TasksPane(QWidget):
     """Container for multiple TaskTabs as tabs."""
     add_task_requested = Signal()
-    remove_task_requested = Signal(int)
+    remove_task_requested = Signal(str)  # task id
+    task_query_changed = Signal(str)
 
     def __init__(self):
         super().__init__()
         layout = QVBoxLayout(self)
 
+        self.query_input = QLineEdit()
+        self.query_input.setPlaceholderText(QUERY_HINT)
+        self.query_input.setClearButtonEnabled(True)
+        layout.addWidget(self.query_input)
+
         self.tabs = QTabWidget()
         self.tabs.setTabPosition(QTabWidget.South)
         layout.addWidget(self.tabs)
@@ -133,30 +195,46 @@ class TasksPane(QWidget):
 
         self.add_button.clicked.connect(lambda: self.add_task_requested.emit())
         self.remove_button.clicked.connect(self._on_remove_clicked)
+        self.query_input.textChanged.connect(self.task_query_changed)
 
-    def add_task_tab(self, task_data, index=None):
-        tab = TaskTab(task_data, task_index=index)
+    def add_task_tab(self, task_data):
+        tab = TaskTab(task_data)
         idx = self.tabs.addTab(tab, task_data.title)
         self.tabs.setCurrentIndex(idx)
-        tab.title_changed.connect(lambda new_title, t=tab: self._on_tab_title_changed(t, new_title))
+        tab.title_changed.connect(self._on_tab_title_changed)
         return tab
 
-    def remove_task_tab(self, index):
-        widget = self.tabs.widget(index)
-        if widget:
-            widget.deleteLater()
-        self.tabs.removeTab(index)
+    def remove_task_tab(self, tab):
+        index = self.tabs.indexOf(tab)
+        if index != -1:
+            self.tabs.removeTab(index)
+        tab.deleteLater()
+
+    def refresh_task_tab(self, tab, task_data):
+        tab.update_from(task_data)
+        index = self.tabs.indexOf(tab)
+        if index != -1:
+            self.tabs.setTabText(index, task_data.title)
+
+    def show_task_query_result(self, ids, error=""):
+        """Hide tabs of tasks not in `ids` (None shows all) and flag a bad query."""
+        self.query_input.setStyleSheet("border: 1px solid #c0392b;" if error else "")
+        self.query_input.setToolTip(error or QUERY_HINT)
+        if error:
+            return
+        for i in range(self.tabs.count()):
+            self.tabs.setTabVisible(i, ids is None or self.tabs.widget(i).task_id in ids)
 
     def update_tab_titles(self, tasks):
         for i, task in enumerate(tasks):
             self.tabs.setTabText(i, task.title)
 
     def _on_remove_clicked(self):
-        idx = self.tabs.currentIndex()
-        if idx >= 0:
-            self.remove_task_requested.emit(idx)
-        
-    def _on_tab_title_changed(self, tab, new_title):
-        index = self.tabs.indexOf(tab)
+        tab = self.tabs.currentWidget()
+        if tab is not None:
+            self.remove_task_requested.emit(tab.task_id)
+
+    def _on_tab_title_changed(self, new_title):
+        index = self.tabs.indexOf(self.sender())
         if index != -1:
             self.tabs.setTabText(index, new_title)
\ No newline at end of file
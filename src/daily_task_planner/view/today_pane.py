@@ -1,8 +1,10 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton,
-    QLineEdit, QListWidget, QListWidgetItem, QMenu, QTextEdit, QTableWidget, QTableWidgetItem
+    QLineEdit, QMenu, QTextEdit, QTableWidget, QTableWidgetItem
 )
 from PySide6.QtCore import Qt, Signal
+from daily_task_planner.view.check_list import CheckListView
+from daily_task_planner.view.filter_bar import FilterBar
 import json
 from pathlib import Path
 
@@ -12,8 +14,13 @@ class TodayPane(QWidget):
     task_added = Signal(str)
     task_changed = Signal(int, str)
     task_checked = Signal(int, bool)
-    task_reordered = Signal(int, int)  # emits list of (description, checked)
+    task_reordered = Signal(int, int)  # (old_index, new_index)
     task_deleted = Signal(int)
+    task_priority_changed = Signal(int, str)
+    task_tags_changed = Signal(int, list)
+    task_query_changed = Signal(str)
+    complete_all_requested = Signal()
+    clear_completed_requested = Signal()
     meeting_added = Signal(str, str)
     meeting_removed = Signal(int)
     notes_changed = Signal(str)
@@ -28,16 +35,15 @@ class TodayPane(QWidget):
         tasks_group = QGroupBox("Tasks For Today")
         tasks_layout = QVBoxLayout()
 
-        self.task_list = QListWidget()
-        self.task_list.setDragDropMode(QListWidget.InternalMove)
-        self.task_list.setDefaultDropAction(Qt.MoveAction)
-        self.task_list.setSelectionMode(QListWidget.SingleSelection)
+        self.task_list = CheckListView()
         self.task_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.task_list.customContextMenuRequested.connect(self._on_task_context_menu)
+        self.task_filter = FilterBar(self.task_list.proxy)
 
         self.task_input = QLineEdit()
         self.task_input.setPlaceholderText("Add a new task and press Enter")
 
+        tasks_layout.addWidget(self.task_filter)
         tasks_layout.addWidget(self.task_list)
         tasks_layout.addWidget(self.task_input)
         tasks_group.setLayout(tasks_layout)
@@ -82,31 +88,22 @@ class TodayPane(QWidget):
 
         # --- Signals ---
         self.task_input.returnPressed.connect(self._on_task_entered)
-        self.task_list.itemDoubleClicked.connect(self._on_edit_task)
-        self.task_list.itemChanged.connect(self._on_task_changed)
-        self.task_list.model().rowsMoved.connect(self._on_rows_moved)
+        self.task_list.source_model.item_edited.connect(self.task_changed)
+        self.task_list.source_model.item_checked.connect(self.task_checked)
+        self.task_list.row_moved.connect(self.task_reordered)
+        self.task_list.priority_set.connect(self.task_priority_changed)
+        self.task_list.tags_set.connect(self.task_tags_changed)
+        self.task_filter.query_changed.connect(self.task_query_changed)
         self.add_meeting_button.clicked.connect(self._on_meeting_added)
         self.remove_meeting_button.clicked.connect(self._on_remove_meeting_clicked)
         self.notes_text.textChanged.connect(self._on_notes_changed)
 
-        # Internal tracking
-        self._editing_index = None
-
         # Populate tasks initially
         self._populate_tasks(tasks)
 
     # === Tasks ===
     def _populate_tasks(self, tasks):
-        self.task_list.blockSignals(True)
-        self.task_list.clear()
-        for task in tasks:
-            item = QListWidgetItem(task.description)
-            item.setFlags(
-                item.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEditable | Qt.ItemIsEnabled
-            )
-            item.setCheckState(Qt.Checked if task.complete else Qt.Unchecked)
-            self.task_list.addItem(item)
-        self.task_list.blockSignals(False)
+        self.task_list.populate(tasks)
 
     def _on_task_entered(self):
         text = self.task_input.text().strip()
@@ -114,53 +111,24 @@ class TodayPane(QWidget):
             self.task_added.emit(text)
             self.task_input.clear()
 
-    def _on_task_checked(self, item):
-        try:
-            index = self.task_list.row(item)
-            if index < 0 or index >= self.task_list.count():
-                return
-            checked = item.checkState() == Qt.Checked
-            self.task_checked.emit(index, checked)
-        except RuntimeError:
-            return
-
-    def _on_edit_task(self, item):
-        self._editing_index = self.task_list.row(item)
-        self.task_list.editItem(item)
-
-    def _on_task_changed(self, item: QListWidgetItem):
-        idx = self.task_list.row(item)
-        if idx == self._editing_index:
-            self.task_changed.emit(idx, item.text())
-            self._editing_index = None
-        else:
-            # Detect checkbox changes
-            checked = item.checkState() == Qt.Checked
-            self.task_checked.emit(idx, checked)   
-    """
-    def _on_rows_moved(self, parent, start, end, destination, row):
-        # Emit full new order like deliverables
-        new_order = [
-            (self.task_list.item(i).text(), self.task_list.item(i).checkState() == Qt.Checked)
-            for i in range(self.task_list.count())
-        ]
-        self.task_reordered.emit(new_order)
-    """
-    def _on_rows_moved(self, parent, start, end, destination, row):
-        if start != row and row <= self.task_list.count():
-            new_index = row if row < start else row - 1
-            self.task_reordered.emit(start, new_index)
-
     def _on_task_context_menu(self, pos):
-        item = self.task_list.itemAt(pos)
-        if item is None:
-            return
+        row = self.task_list.source_row_at(pos)
         menu = QMenu()
-        delete_action = menu.addAction("Delete")
+        delete_action = menu.addAction("Delete") if row >= 0 else None
+        if row >= 0:
+            self.task_list.add_record_actions(menu, row)
+        menu.addSeparator()
+        complete_all_action = menu.addAction("Mark All Complete")
+        clear_completed_action = menu.addAction("Clear Completed")
         action = menu.exec(self.task_list.mapToGlobal(pos))
+        if action is None:
+            return
         if action == delete_action:
-            index = self.task_list.row(item)
-            self.task_deleted.emit(index)
+            self.task_deleted.emit(row)
+        elif action == complete_all_action:
+            self.complete_all_requested.emit()
+        elif action == clear_completed_action:
+            self.clear_completed_requested.emit()
 
     # === Meetings ===
     def _on_meeting_added(self):
@@ -191,6 +159,9 @@ class TodayPane(QWidget):
     def update_task_list(self, tasks):
         self._populate_tasks(tasks)
 
+    def show_task_query_result(self, ids, error=""):
+        self.task_filter.show_query_result(ids, error)
+
     def update_notes(self, text):
         if text != self.notes_text.toPlainText():
             self.notes_text.setPlainText(text)
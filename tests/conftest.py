@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+from daily_task_planner.model.task_model import UnifiedModel
+
+
+@pytest.fixture
+def model(tmp_path):
+    return UnifiedModel(tmp_path / "data.json")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
@@ -0,0 +1,106 @@
+import pytest
+
+from daily_task_planner.model.task_model import Task
+
+
+@pytest.fixture
+def view(qapp):
+    from daily_task_planner.view.check_list import CheckListView
+    return CheckListView()
+
+
+def shown(view):
+    return [view.proxy.index(r, 0).data() for r in range(view.proxy.rowCount())]
+
+
+def record_signals(model):
+    signals = []
+    model.modelReset.connect(lambda: signals.append("reset"))
+    model.rowsInserted.connect(lambda _, first, last: signals.append(("inserted", first, last)))
+    model.rowsRemoved.connect(lambda _, first, last: signals.append(("removed", first, last)))
+    model.dataChanged.connect(lambda top, bottom: signals.append(("changed", top.row(), bottom.row())))
+    return signals
+
+
+# --- CheckListModel.set_items ---
+def test_set_items_signals_only_what_changed(view):
+    items = [Task(f"t{i}") for i in range(5)]
+    view.populate(items)
+    signals = record_signals(view.source_model)
+
+    items.append(Task("added"))
+    view.populate(items)
+    del items[1:3]
+    view.populate(items)
+    items[2].priority = "high"
+    view.populate(items)
+    view.populate(items)
+
+    assert signals == [("inserted", 5, 5), ("removed", 1, 2), ("changed", 2, 2)]
+    assert view.source_model.items() == [(t.description, False) for t in items]
+
+
+def test_sorted_view_follows_changes(view):
+    items = [Task(f"t{i}", complete=i % 2 == 0) for i in range(6)]
+    view.populate(items)
+    view.proxy.set_incomplete_first(True)
+    assert shown(view) == ["t1", "t3", "t5", "t0", "t2", "t4"]
+
+    for i in (1, 2, 3):
+        items[i].complete = not items[i].complete
+    items.insert(1, Task("new"))
+    view.populate(items)
+    assert shown(view) == ["new", "t2", "t5", "t0", "t1", "t3", "t4"]
+
+    view.proxy.set_hide_completed(True)
+    view.proxy.set_filter_text("T")
+    assert shown(view) == ["t2", "t5"]
+
+
+# --- Drag and drop ---
+def drop(view, items, from_row, proxy_row):
+    """Drop source row `from_row` before proxy row `proxy_row`; returns the emitted move."""
+    moves = []
+    view.row_moved.connect(lambda a, b: moves.append((a, b)))
+    view.drop_row(from_row, proxy_row)
+    # The presenter applies the move to the model the same way
+    if moves:
+        items.insert(moves[0][1], items.pop(moves[0][0]))
+    view.populate(items)
+    return moves
+
+
+def descriptions(view):
+    return [d for d, _ in view.source_model.items()]
+
+
+def test_drop_while_filtered_maps_to_source_rows(view):
+    items = [Task(f"t{i}", complete=i in (1, 2)) for i in range(5)]
+    view.populate(items)
+    view.proxy.set_hide_completed(True)
+    assert shown(view) == ["t0", "t3", "t4"]
+
+    # t4 dropped before t3: lands after the hidden t1, t2
+    assert drop(view, items, 4, 1) == [(4, 3)]
+    assert descriptions(view) == ["t0", "t1", "t2", "t4", "t3"]
+    # t0 dropped at the end
+    assert drop(view, items, 0, 3) == [(0, 4)]
+    assert descriptions(view) == ["t1", "t2", "t4", "t3", "t0"]
+    assert shown(view) == ["t4", "t3", "t0"]
+
+
+def test_drop_while_sorted_maps_to_source_rows(view):
+    items = [Task(f"t{i}", complete=i % 2 == 0) for i in range(5)]
+    view.populate(items)
+    view.proxy.set_incomplete_first(True)
+    assert shown(view) == ["t1", "t3", "t0", "t2", "t4"]
+
+    # t3 dropped before t1
+    assert drop(view, items, 3, 0) == [(3, 1)]
+    assert descriptions(view) == ["t0", "t3", "t1", "t2", "t4"]
+    # t0 dropped before t4
+    assert drop(view, items, 0, 4) == [(0, 3)]
+    assert descriptions(view) == ["t3", "t1", "t2", "t0", "t4"]
+    assert shown(view) == ["t3", "t1", "t2", "t0", "t4"]
+    # Dropping a row back onto its own place is not a move
+    assert drop(view, items, 0, 1) == []
@@ -0,0 +1,15 @@
+from daily_task_planner.diagnostics.memory_tracker import MemoryTracker
+from daily_task_planner.diagnostics.stress_test import make_cycle
+
+
+def test_add_remove_cycles_leave_no_live_objects(qapp, tmp_path):
+    cycle = make_cycle(tmp_path / "planner.json", deliverables=3)
+    cycle()  # lazily created objects exist from here on
+    tracker = MemoryTracker()
+    tracker.start()
+    try:
+        for _ in range(5):
+            cycle()
+        assert tracker.count_growth() == {}
+    finally:
+        tracker.stop()
@@ -0,0 +1,64 @@
+import pytest
+
+from daily_task_planner.model.record_index import RecordIndex, parse_query
+
+
+def fresh_terms(model):
+    index = RecordIndex()
+    for t in model.today.tasks:
+        index.update("today_task", t)
+    for task in model.tasks:
+        index.update("task", task)
+        for d in task.deliverables:
+            index.update("deliverable", d)
+    return index._terms
+
+
+# --- parse_query ---
+def test_parse_query_terms_and_negation():
+    assert parse_query("priority:high #Release not complete") == (["priority:high", "tag:release"], ["complete"])
+    assert parse_query("-tag:x !done incomplete") == ([], ["tag:x", "complete", "complete"])
+    assert parse_query("not not complete and kind:task") == (["complete", "kind:task"], [])
+
+
+@pytest.mark.parametrize("expr", ["priority:high not", "priority:high -", "tag:a !", "not", "not not"])
+def test_parse_query_rejects_dangling_negation(expr):
+    with pytest.raises(ValueError):
+        parse_query(expr)
+
+
+@pytest.mark.parametrize("expr", ["priority:urgent", "kind:meeting", "tag:", "foo"])
+def test_parse_query_rejects_unknown_terms(expr):
+    with pytest.raises(ValueError):
+        parse_query(expr)
+
+
+# --- Queries over the model ---
+def test_query_follows_mutations(model):
+    release = model.add_task()
+    model.set_task_tags(0, ["#Release"])
+    model.add_deliverable(0, "docs")
+    model.add_deliverable(0, "ship")
+    model.set_deliverable_priority(0, 1, "high")
+    model.add_today_task("standup")
+    model.set_today_task_priority(0, "high")
+
+    assert model.query_ids("tag:release") == {release.id}
+    ship = model.tasks[0].deliverables[1].id
+    assert model.query_ids("priority:high", kinds=["deliverable"]) == {ship}
+    assert model.query_ids("priority:high") == {ship, model.today.tasks[0].id}
+
+    # A task is complete once all its deliverables are
+    model.set_deliverable_complete(0, 0, True)
+    assert model.query_ids("complete", kinds=["task"]) == set()
+    model.set_deliverable_complete(0, 1, True)
+    assert model.query_ids("complete", kinds=["task"]) == {release.id}
+    assert model.query_ids("tag:release not complete") == set()
+
+    model.set_task_tags(0, [])
+    assert model.query_ids("tag:release") == set()
+    model.remove_deliverable(0, 1)
+    assert model.query_ids("priority:high", kinds=["deliverable"]) == set()
+    model.remove_task(0)
+    assert model.query_ids("kind:deliverable") == set()
+    assert model.index._terms == fresh_terms(model)
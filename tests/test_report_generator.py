@@ -0,0 +1,31 @@
+from datetime import date, timedelta
+
+from daily_task_planner.model.task_model import UnifiedModel
+from daily_task_planner.report import report_generator
+
+
+def archive_days(model, count):
+    for i in range(count):
+        model.add_today_task(f"task {i}")
+        model.set_today_task_complete(len(model.today.tasks) - 1, True)
+        model.rollover_day(date.fromisoformat(model.today.date) + timedelta(days=1))
+
+
+def test_history_streams_when_not_loaded(model):
+    archive_days(model, 3)
+
+    lazy = UnifiedModel(model.storage_path, load_history=False)
+    assert lazy.history == []
+    assert [d.date for d in lazy.iter_history()] == [d.date for d in model.history]
+
+
+def test_cli_reports_archived_days(model, tmp_path):
+    archive_days(model, 3)
+    out = tmp_path / "report.md"
+
+    report_generator.main(["all", "-o", str(out), "--data", str(model.storage_path)])
+
+    text = out.read_text(encoding="utf-8")
+    for day in model.history:
+        assert f"### {day.date}" in text
+    assert "- [x] task 2" in text
@@ -0,0 +1,213 @@
+import random
+
+import pytest
+
+from daily_task_planner.model.task_model import UnifiedModel
+from daily_task_planner.sync.delta import SYNCED_KINDS, SyncState, merge_entry
+from daily_task_planner.sync.sync_server import SyncStore
+
+
+class Replica:
+    """A model and its sync state, synced by hand the way SyncService does it."""
+
+    def __init__(self, tmp_path, name, store):
+        self.name, self.store, self.tmp_path = name, store, tmp_path
+        self.model = UnifiedModel(tmp_path / f"{name}.json")
+        self.state = SyncState(tmp_path / f"{name}_sync.json")
+        self.dirty = {f"{kind}:*" for kind in SYNCED_KINDS}
+        self.applying = False
+        self.model.add_listener(self._on_model_changed)
+
+    def _on_model_changed(self, changes):
+        if not self.applying:
+            self.dirty |= {key for key in changes if key.partition(":")[0] in SYNCED_KINDS}
+
+    def push(self):
+        dirty, self.dirty = self.dirty, set()
+        self.state.record_local(self.model, dirty)
+        pending = self.state.pending()
+        if pending:
+            self.store.push(pending)
+            self.state.ack(pending)
+        self.state.save()
+
+    def pull(self):
+        seq, changes = self.store.pull(self.state.since)
+        keys = self.state.merge_remote(changes)
+        self.state.since = seq
+        if keys:
+            self.applying = True
+            try:
+                self.state.apply_to_model(self.model, keys)
+            finally:
+                self.applying = False
+        self.state.save()
+
+    def sync(self):
+        self.push()
+        self.pull()
+
+    def restart(self):
+        self.push()
+        self.model.remove_listener(self._on_model_changed)
+        return Replica(self.tmp_path, self.name, self.store)
+
+
+def snapshot(model):
+    return model.today.to_dict(), [t.to_dict() for t in model.tasks]
+
+
+def settle(*replicas):
+    for _ in range(2):
+        for r in replicas:
+            r.sync()
+
+
+@pytest.fixture
+def pair(tmp_path):
+    store = SyncStore()
+    return Replica(tmp_path, "a", store), Replica(tmp_path, "b", store)
+
+
+# --- merge_entry ---
+def test_merge_entry_keeps_dominating_edit():
+    old = {"value": "old", "vv": {"a": 1}}
+    new = {"value": "new", "vv": {"a": 2, "b": 1}}
+    assert merge_entry(old, new) is new
+    assert merge_entry(new, old) is new
+    assert merge_entry(None, old) is old
+
+
+def test_merge_entry_concurrent_edits_are_order_independent():
+    a = {"value": "from a", "vv": {"a": 2}}
+    b = {"value": "from b", "vv": {"b": 2}}
+    ab, ba = merge_entry(a, b), merge_entry(b, a)
+    assert ab == ba
+    assert ab["vv"] == {"a": 2, "b": 2}
+    # The merged entry dominates both, so it wins against either again
+    assert merge_entry(ab, a) is ab and merge_entry(ab, b) is ab
+
+
+# --- Convergence ---
+def test_concurrent_edits_of_one_field_converge(pair):
+    a, b = pair
+    a.model.add_task()
+    settle(a, b)
+
+    a.model.update_task_title(0, "from a")
+    b.model.update_task_title(0, "from b")
+    b.model.update_task_notes(0, "notes from b")
+    settle(a, b)
+
+    assert snapshot(a.model) == snapshot(b.model)
+    assert a.model.tasks[0].title in ("from a", "from b")
+    assert a.model.tasks[0].notes == "notes from b"
+
+
+def test_concurrent_edit_and_delete_converge(pair):
+    a, b = pair
+    a.model.add_task()
+    a.model.add_deliverable(0, "docs")
+    a.model.add_deliverable(0, "ship")
+    settle(a, b)
+
+    a.model.remove_task(0)
+    b.model.set_deliverable_complete(0, 1, True)
+    b.model.add_deliverable(0, "added meanwhile")
+    settle(a, b)
+
+    assert snapshot(a.model) == snapshot(b.model)
+    assert a.model.tasks == []
+    assert a.model.query_ids("kind:deliverable") == b.model.query_ids("kind:deliverable") == set()
+
+
+def test_moves_keep_other_positions(pair):
+    a, b = pair
+    a.model.add_task()
+    for i in range(5):
+        a.model.add_deliverable(0, f"d{i}")
+    settle(a, b)
+
+    a.model.move_deliverable(0, 4, 1)
+    a.model.move_deliverable(0, 0, 3)
+    changes = a.state.record_local(a.model, a.dirty)
+    a.dirty.clear()
+    # Only the two moved records get a new position
+    assert [c["field"] for c in changes] == ["order", "order"]
+    a.sync()
+    b.sync()
+
+    assert [d.description for d in b.model.tasks[0].deliverables] == ["d4", "d1", "d2", "d0", "d3"]
+    assert snapshot(a.model) == snapshot(b.model)
+
+
+def test_offline_edits_survive_restart(tmp_path):
+    store = SyncStore()
+    a, b = Replica(tmp_path, "a", store), Replica(tmp_path, "b", store)
+    a.model.add_today_task("offline")
+    a.state.record_local(a.model, a.dirty)
+    a.dirty.clear()
+    a.state.save()  # recorded, never pushed
+
+    a = Replica(tmp_path, "a", store)
+    assert a.state.pending()
+    settle(a, b)
+    assert [t.description for t in b.model.today.tasks] == ["offline"]
+    assert a.state.pending() == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_edits_converge(tmp_path, seed):
+    rnd = random.Random(seed)
+    store = SyncStore(tmp_path / "store.json")
+    replicas = [Replica(tmp_path, name, store) for name in "abc"]
+
+    def edit(model):
+        tasks = model.tasks
+        choice = rnd.randrange(10)
+        if choice == 0 or not tasks:
+            model.add_task()
+        elif choice == 1:
+            model.add_today_task(f"t{rnd.randrange(9)}")
+        elif choice == 2 and model.today.tasks:
+            model.move_today_task(rnd.randrange(len(model.today.tasks)), 0)
+        elif choice == 3:
+            model.set_today_notes(f"n{rnd.randrange(9)}")
+        elif choice == 4 and rnd.random() < 0.3:
+            model.remove_task(rnd.randrange(len(tasks)))
+        elif choice == 5:
+            model.update_task_title(rnd.randrange(len(tasks)), f"title {rnd.randrange(9)}")
+        else:
+            t = rnd.randrange(len(tasks))
+            n = len(tasks[t].deliverables)
+            if choice == 6 or not n:
+                model.add_deliverable(t, f"d{rnd.randrange(9)}")
+            elif choice == 7:
+                model.move_deliverable(t, rnd.randrange(n), rnd.randrange(n))
+            elif choice == 8:
+                model.set_deliverable_complete(t, rnd.randrange(n), rnd.random() < 0.5)
+            else:
+                model.remove_deliverable(t, rnd.randrange(n))
+
+    for _ in range(300):
+        i = rnd.randrange(len(replicas))
+        roll = rnd.random()
+        if roll < 0.7:
+            edit(replicas[i].model)
+        elif roll < 0.97:
+            replicas[i].sync()
+        else:
+            replicas[i] = replicas[i].restart()
+    settle(*replicas)
+
+    first = snapshot(replicas[0].model)
+    for r in replicas[1:]:
+        assert snapshot(r.model) == first
+    for r in replicas:
+        # Index patched record by record matches a rebuild
+        terms = dict(r.model.index._terms)
+        r.model._rebuild_index()
+        assert r.model.index._terms == terms
+        # Journal replays to the same state
+        reloaded = SyncState(r.state.path)
+        assert (reloaded.fields, reloaded.unacked, reloaded.since) == (r.state.fields, r.state.unacked, r.state.since)
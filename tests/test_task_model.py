@@ -0,0 +1,153 @@
+from datetime import date, datetime, timedelta
+import os
+
+import pytest
+
+from daily_task_planner.model.task_model import UnifiedModel, carried_id
+
+
+def next_day(model):
+    return date.fromisoformat(model.today.date) + timedelta(days=1)
+
+
+def snapshot(model):
+    return model.today.to_dict(), [t.to_dict() for t in model.tasks], len(model.history)
+
+
+# --- Batches ---
+def test_batch_saves_and_notifies_once(model, monkeypatch):
+    saves, notified = [], []
+    monkeypatch.setattr(model, "save", lambda: saves.append(1))
+    model.add_listener(notified.append)
+
+    with model.batch():
+        task = model.add_task()
+        model.update_task_title(0, "release")
+        with model.batch():
+            model.add_deliverable(0, "docs")
+            model.add_today_task("standup")
+        model.set_today_notes("notes")
+
+    assert len(saves) == 1 and len(notified) == 1
+    assert notified[0] >= {"tasks", "today.tasks", "today.notes", f"task:{task.id}"}
+
+
+def test_batch_rollback_restores_state_and_index(model):
+    model.add_task()
+    model.add_deliverable(0, "docs")
+    model.add_deliverable(0, "ship")
+    model.set_task_priority(0, "high")
+    model.add_today_task("standup")
+    model.add_meeting("9:00", "sync")
+    before = snapshot(model)
+    queries = model.query_ids("priority:high"), model.query_ids("kind:deliverable")
+
+    with pytest.raises(RuntimeError):
+        with model.batch():
+            model.set_task_priority(0, "low")
+            model.set_deliverable_complete(0, 0, True)
+            model.move_deliverable(0, 1, 0)
+            model.add_deliverable(0, "more")
+            model.reorder_deliverables(0, [("ship", False)])
+            model.set_today_task_tags(0, ["ops"])
+            model.reorder_today_tasks([("new", False)])
+            model.set_today_notes("changed")
+            model.remove_meeting(0)
+            model.add_task()
+            model.remove_task(0)
+            model.rollover_day(next_day(model))
+            raise RuntimeError("abort")
+
+    assert snapshot(model) == before
+    assert (model.query_ids("priority:high"), model.query_ids("kind:deliverable")) == queries
+    assert model.query_ids("complete") == set()
+    terms = dict(model.index._terms)
+    model._rebuild_index()
+    assert model.index._terms == terms
+
+
+# --- Day rollover ---
+def test_rollover_carries_incomplete_tasks(model):
+    model.add_today_task("done")
+    model.add_today_task("carry me")
+    model.set_today_task_complete(0, True)
+    model.set_today_task_tags(1, ["ops"])
+    model.set_today_task_priority(1, "high")
+    model.add_meeting("9:00", "standup")
+    model.set_today_notes("notes")
+    old_day, old_id = model.today.date, model.today.tasks[1].id
+
+    assert model.rollover_day(next_day(model))
+
+    assert [t.description for t in model.today.tasks] == ["carry me"]
+    carried = model.today.tasks[0]
+    assert carried.id == carried_id(old_id, model.today.date)
+    assert (carried.complete, carried.priority, carried.tags) == (False, "high", ["ops"])
+    assert model.today.meetings == [] and model.today.notes == ""
+    assert [d.date for d in model.history] == [old_day]
+    assert [m.description for m in model.history[0].meetings] == ["standup"]
+    assert model.query_ids("tag:ops") == {carried.id}
+
+
+def test_rollover_only_once_per_day(model):
+    model.add_today_task("task")
+    day = next_day(model)
+    assert model.rollover_day(day)
+    assert not model.rollover_day(day)
+    assert len(model.history) == 1 and len(model.today.tasks) == 1
+
+
+def test_rollover_carries_undone_deliverables_when_enabled(model):
+    model.add_today_task("write docs")
+    model.add_task()
+    for description in ("write docs", "ship", "review"):
+        model.add_deliverable(0, description)
+    model.set_deliverable_complete(0, 2, True)
+    model.set_carry_deliverables(True)
+
+    model.rollover_day(next_day(model))
+
+    # Already-carried descriptions aren't added twice; done deliverables stay behind
+    assert [t.description for t in model.today.tasks] == ["write docs", "ship"]
+    assert model.today.tasks[1].id == carried_id(model.tasks[0].deliverables[1].id, model.today.date)
+
+
+def test_rollover_is_deterministic_across_copies(tmp_path):
+    a = UnifiedModel(tmp_path / "a.json")
+    a.add_today_task("carry me")
+    (tmp_path / "b.json").write_text((tmp_path / "a.json").read_text())
+    b = UnifiedModel(tmp_path / "b.json")
+
+    day = next_day(a)
+    a.rollover_day(day)
+    b.rollover_day(day)
+    assert [t.id for t in a.today.tasks] == [t.id for t in b.today.tasks]
+
+
+def test_history_is_appended_to_its_own_file(tmp_path):
+    model = UnifiedModel(tmp_path / "data.json")
+    model.add_today_task("first")
+    model.rollover_day(next_day(model))
+    model.rollover_day(next_day(model))
+
+    assert "history" not in (tmp_path / "data.json").read_text()
+    assert len(model.history_path.read_text().splitlines()) == 2
+
+    reloaded = UnifiedModel(tmp_path / "data.json")
+    assert [d.date for d in reloaded.history] == [d.date for d in model.history]
+    assert [t.description for t in reloaded.history[0].tasks] == ["first"]
+
+
+def test_undated_file_takes_its_date_from_mtime(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"today": {"tasks": [{"description": "old"}]}, "tasks": []}')
+    written = datetime(2024, 3, 5, 12, 0).timestamp()
+    os.utime(path, (written, written))
+
+    model = UnifiedModel(path)
+    assert model.today.date == "2024-03-05"
+    assert model.needs_rollover()
+
+
+def test_fresh_model_starts_today(model):
+    assert model.today.date == date.today().isoformat()
@@ -0,0 +1,42 @@
+import json
+
+from daily_task_planner.trace.trace_recorder import TRACED_METHODS, TraceRecorder
+from daily_task_planner.trace.trace_replay import replay_args
+
+# Stands in for TasksPresenter without a view; unused operations do nothing
+NoopPresenter = type("NoopPresenter", (), {name: lambda self, *args: None for name in TRACED_METHODS["tasks"]})
+
+
+class FakePresenter(NoopPresenter):
+    def __init__(self, model):
+        self.model = model
+
+    def add_task(self):
+        self.model.add_task()
+
+    def update_title(self, index, title):
+        self.model.update_task_title(index, title)
+
+
+def test_recorder_writes_each_call_before_close(tmp_path, model):
+    recorder = TraceRecorder(tmp_path / "trace.jsonl", model)
+    presenter = recorder.traced(FakePresenter, "tasks")(model)
+    recorder.start()
+    presenter.add_task()
+    presenter.update_title(0, "release")
+
+    lines = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text().splitlines()]
+    assert [e.get("op") for e in lines] == [None, "add_task", "update_title"]
+    assert lines[1]["created"] == model.tasks[0].id
+    recorder.close()
+
+
+def test_replay_maps_only_task_id_arguments():
+    ids = {"recorded": "replayed"}
+    remove = {"target": "tasks", "op": "remove_task", "args": ["recorded"]}
+    title = {"target": "tasks", "op": "update_title", "args": [0, "recorded"]}
+    today = {"target": "today", "op": "add_task", "args": ["recorded"]}
+
+    assert replay_args(remove, ids) == ["replayed"]
+    assert replay_args(title, ids) == [0, "recorded"]
+    assert replay_args(today, ids) == ["recorded"]